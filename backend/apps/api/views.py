@@ -20,11 +20,12 @@ Endpoints defined here:
 from rest_framework import viewsets, status
 from rest_framework.decorators import api_view, action
 from rest_framework.response import Response
-from django.db.models import Count, Avg, Q
+from django.db.models import Count, Avg, Q, prefetch_related_objects
 from apps.core.models import Study, Site, Subject
 from apps.monitoring.models import Query, MissingVisit, MissingPage
 from apps.safety.models import SAEDiscrepancy
-from apps.metrics.models import CleanPatientStatus, DQIScoreSubject, DQIScoreSite, DQIScoreStudy
+from apps.metrics.models import DQIScoreSubject, DQIScoreStudy
+from apps.metrics.services.aggregates import count_subquery
 from .serializers import (
     SubjectListSerializer, StudySummarySerializer,
     KPICardSerializer, OpenIssueSerializer
@@ -209,7 +210,7 @@ def frontend_overview_data(request):
     # Each query counts open issues for the study
     open_queries = Query.objects.filter(
         subject__study=study,
-        query_status='Open'
+        query_status=Query.QueryStatus.OPEN
     ).count()
 
     missing_visits = MissingVisit.objects.filter(
@@ -347,8 +348,10 @@ def site_list(request):
     """
     study_id = request.query_params.get('study_id', 'Study_1')
 
-    # Fetch sites with related objects for efficiency
-    sites = Site.objects.filter(study_id=study_id).select_related('country', 'dqi_score')
+    # Fetch sites with related objects and subject counts in one query
+    sites = Site.objects.filter(study_id=study_id).select_related(
+        'country', 'dqi_score'
+    ).annotate(subject_total=Count('subjects'))
 
     site_data = []
     for site in sites:
@@ -371,7 +374,7 @@ def site_list(request):
             'site_name': site.site_name or 'N/A',
             'country': site.country.country_name,
             'region': site.country.region,
-            'total_subjects': Subject.objects.filter(site=site).count(),
+            'total_subjects': site.subject_total,
             'clean_percentage': clean_pct,
             'dqi_score': dqi_score,
             'risk_band': risk_band
@@ -415,17 +418,20 @@ def at_risk_subjects(request):
     try:
         # Query subjects with High or Critical risk bands
         # Order by DQI score ascending (worst first)
-        at_risk = DQIScoreSubject.objects.filter(
+        at_risk = list(DQIScoreSubject.objects.filter(
             subject__study_id=study_id,
             risk_band__in=['High', 'Critical']
-        ).select_related('subject', 'subject__site').order_by('composite_dqi_score')[:limit]
+        ).select_related('subject', 'subject__site').order_by('composite_dqi_score')[:limit])
+
+        # Hydrate clean patient status for the whole page in one IN (...) query
+        prefetch_related_objects(at_risk, 'subject__clean_status')
 
         subjects_data = []
         for dqi in at_risk:
             subject = dqi.subject
             
             # Get clean patient status for additional context
-            clean_status = CleanPatientStatus.objects.filter(subject=subject).first()
+            clean_status = getattr(subject, 'clean_status', None)
 
             subjects_data.append({
                 'subject_id': subject.subject_external_id,
@@ -473,49 +479,56 @@ def risk_heatmap_data(request):
     study_id = request.query_params.get('study_id', 'Study_1')
     
     try:
-        # Get all sites for the study
-        sites = Site.objects.filter(study_id=study_id).select_related('country')
+        # Get all sites for the study with every backlog count computed
+        # in the same SELECT (one correlated COUNT subquery per fact table)
+        sites = Site.objects.filter(study_id=study_id).select_related(
+            'country', 'dqi_score'
+        ).annotate(
+            subject_count=count_subquery(Subject.objects.all(), 'site'),
+            open_query_count=count_subquery(
+                Query.objects.filter(query_status=Query.QueryStatus.OPEN), 'subject__site'
+            ),
+            missing_page_count=count_subquery(
+                MissingPage.objects.filter(is_resolved=False), 'subject__site'
+            ),
+            missing_visit_count=count_subquery(
+                MissingVisit.objects.filter(is_resolved=False), 'subject__site'
+            ),
+            sae_count=count_subquery(
+                SAEDiscrepancy.objects.filter(resolution_status__in=[
+                    SAEDiscrepancy.ResolutionStatus.OPEN,
+                    SAEDiscrepancy.ResolutionStatus.PENDING,
+                ]), 'subject__site'
+            ),
+        )
         
         heatmap_data = []
         
         for site in sites:
             # Calculate risk metrics for each dimension
-            site_subjects = Subject.objects.filter(site=site)
-            subject_count = site_subjects.count()
+            subject_count = site.subject_count
             
             if subject_count == 0:
                 continue
             
             # Query backlog
-            query_count = Query.objects.filter(
-                subject__site=site, 
-                query_status='Open'
-            ).count()
+            query_count = site.open_query_count
             query_risk = 'critical' if query_count > 25 else 'high' if query_count > 15 else 'medium' if query_count > 5 else 'low'
             
             # Missing pages
-            missing_pages = MissingPage.objects.filter(
-                subject__site=site,
-                is_resolved=False
-            ).count()
+            missing_pages = site.missing_page_count
             pages_risk = 'high' if missing_pages > 10 else 'medium' if missing_pages > 3 else 'low'
             
             # Missing visits
-            missing_visits = MissingVisit.objects.filter(
-                subject__site=site,
-                is_resolved=False
-            ).count()
+            missing_visits = site.missing_visit_count
             visit_risk = 'high' if missing_visits > 5 else 'medium' if missing_visits > 2 else 'low'
             
             # SAE backlog
-            sae_count = SAEDiscrepancy.objects.filter(
-                subject__site=site,
-                resolution_status__in=['Open', 'Pending']
-            ).count()
+            sae_count = site.sae_count
             safety_risk = 'critical' if sae_count > 3 else 'high' if sae_count > 1 else 'medium' if sae_count > 0 else 'low'
             
             # Get site DQI score
-            site_dqi = DQIScoreSite.objects.filter(site=site).first()
+            site_dqi = getattr(site, 'dqi_score', None)
             dqi_score = float(site_dqi.composite_dqi_score) if site_dqi else 75.0
             
             # Calculate overall risk
@@ -527,7 +540,7 @@ def risk_heatmap_data(request):
             heatmap_data.append({
                 'site_id': site.site_id,
                 'site_number': site.site_number,
-                'site_name': f"Site {site.site_number} - {site.city or 'Unknown'}",
+                'site_name': f"Site {site.site_number} - {site.site_name or 'Unknown'}",
                 'country': site.country.country_name if site.country else 'Unknown',
                 'subject_count': subject_count,
                 'dqi_score': dqi_score,
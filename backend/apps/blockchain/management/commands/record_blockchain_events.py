@@ -75,8 +75,8 @@ class Command(BaseCommand):
         try:
             resolved_queries = Query.objects.filter(
                 subject__study_id=study_id,
-                query_status='Closed'
-            )[:5]  # First 5 for demo
+                query_status=Query.QueryStatus.CLOSED
+            ).defer('suggested_response').order_by('-query_open_date')[:5]  # Latest 5 for demo
 
             for query in resolved_queries:
                 service.record_query_resolution(
@@ -4,10 +4,11 @@ Django admin configuration for core models.
 Provides admin interface for managing:
 - Studies, Countries, Sites, Subjects
 - Visits, FormPages
+- Interned EDC labels (StringDict)
 """
 
 from django.contrib import admin
-from .models import Study, Country, Site, Subject, Visit, FormPage
+from .models import Study, Country, Site, Subject, Visit, FormPage, StringDict
 
 
 @admin.register(Study)
@@ -56,3 +57,11 @@ class FormPageAdmin(admin.ModelAdmin):
     list_filter = ['status', 'folder_name']
     search_fields = ['form_name', 'page_name']
     ordering = ['visit', 'folder_name', 'form_name']
+
+
+@admin.register(StringDict)
+class StringDictAdmin(admin.ModelAdmin):
+    list_display = ['id', 'kind', 'value']
+    list_filter = ['kind']
+    search_fields = ['value']
+    ordering = ['kind', 'value']
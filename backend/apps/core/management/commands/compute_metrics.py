@@ -11,12 +11,13 @@ Architecture Integration:
 """
 
 from django.core.management.base import BaseCommand
-from django.db.models import Count, Q, Sum, Avg
+from django.db.models import Count, Q, Sum, Avg, prefetch_related_objects
 from apps.core.models import Study, Site, Subject
 from apps.monitoring.models import Query, MissingVisit, MissingPage, NonConformantEvent, SDVStatus, PISignatureStatus
 from apps.safety.models import SAEDiscrepancy, LabIssue
 from apps.medical_coding.models import CodingItem, EDRROpenIssue
 from apps.metrics.models import CleanPatientStatus, DQIScoreSubject, DQIScoreSite, DQIScoreStudy, DQIWeightConfig
+from apps.metrics.services.aggregates import count_subquery
 import json
 
 
@@ -59,16 +60,30 @@ class Command(BaseCommand):
         """Compute Clean Patient Status for all subjects in study."""
         self.stdout.write('Computing Clean Patient Status...')
 
-        subjects = Subject.objects.filter(study=study)
+        # Blocker counts are computed by the database alongside the subject rows
+        subjects = Subject.objects.filter(study=study).annotate(
+            missing_visit_total=count_subquery(MissingVisit.objects.all(), 'subject'),
+            missing_page_total=count_subquery(MissingPage.objects.all(), 'subject'),
+            open_query_total=count_subquery(
+                Query.objects.filter(query_status=Query.QueryStatus.OPEN), 'subject'
+            ),
+            non_conformant_total=count_subquery(
+                NonConformantEvent.objects.filter(status='Open'), 'subject'
+            ),
+            sae_total=count_subquery(SAEDiscrepancy.objects.all(), 'subject'),
+            coding_uncoded_total=count_subquery(
+                CodingItem.objects.filter(coding_status__in=['Uncoded', 'Pending']), 'subject'
+            ),
+        )
         computed = 0
 
         for subject in subjects:
             # Count blockers
-            missing_visits = MissingVisit.objects.filter(subject=subject).count()
-            missing_pages = MissingPage.objects.filter(subject=subject).count()
-            open_queries = Query.objects.filter(subject=subject, query_status='Open').count()
-            non_conformant = NonConformantEvent.objects.filter(subject=subject, status='Open').count()
-            sae_discrepancies = SAEDiscrepancy.objects.filter(subject=subject).count()
+            missing_visits = subject.missing_visit_total
+            missing_pages = subject.missing_page_total
+            open_queries = subject.open_query_total
+            non_conformant = subject.non_conformant_total
+            sae_discrepancies = subject.sae_total
 
             # Get SDV completion
             sdv_record = SDVStatus.objects.filter(subject=subject).first()
@@ -81,10 +96,7 @@ class Command(BaseCommand):
             pi_incomplete = pi_pct < 100
 
             # Get coding backlog
-            coding_uncoded = CodingItem.objects.filter(
-                subject=subject,
-                coding_status__in=['Uncoded', 'Pending']
-            ).count()
+            coding_uncoded = subject.coding_uncoded_total
 
             # Get EDRR issues
             edrr = EDRROpenIssue.objects.filter(subject=subject).first()
@@ -153,13 +165,14 @@ class Command(BaseCommand):
         """Compute DQI scores at subject level."""
         self.stdout.write('Computing DQI scores (subject level)...')
 
-        subjects = Subject.objects.filter(study=study)
+        subjects = list(Subject.objects.filter(study=study))
+        prefetch_related_objects(subjects, 'clean_status')
         weights = {w.metric_name: w.weight for w in DQIWeightConfig.objects.filter(is_active=True)}
 
         computed = 0
 
         for subject in subjects:
-            clean_status = CleanPatientStatus.objects.filter(subject=subject).first()
+            clean_status = getattr(subject, 'clean_status', None)
             if not clean_status:
                 continue
 
@@ -223,26 +236,26 @@ class Command(BaseCommand):
         """Roll up DQI to site level."""
         self.stdout.write('Computing DQI scores (site level)...')
 
-        sites = Site.objects.filter(study=study)
+        # Subject, clean-subject and average DQI per site in one grouped query.
+        # clean_status and dqi_score are one-to-one, so the joins do not fan out.
+        sites = Site.objects.filter(study=study).annotate(
+            subject_total=Count('subjects'),
+            clean_total=Count('subjects', filter=Q(subjects__clean_status__is_clean=True)),
+            avg_dqi=Avg('subjects__dqi_score__composite_dqi_score'),
+        )
 
         for site in sites:
-            subjects = Subject.objects.filter(site=site)
-            total_subjects = subjects.count()
+            total_subjects = site.subject_total
 
             if total_subjects == 0:
                 continue
 
-            clean_subjects = CleanPatientStatus.objects.filter(
-                subject__in=subjects,
-                is_clean=True
-            ).count()
+            clean_subjects = site.clean_total
 
             clean_pct = (clean_subjects / total_subjects * 100) if total_subjects > 0 else 0
 
             # Average DQI score
-            avg_dqi = DQIScoreSubject.objects.filter(
-                subject__in=subjects
-            ).aggregate(Avg('composite_dqi_score'))['composite_dqi_score__avg'] or 0
+            avg_dqi = site.avg_dqi or 0
 
             # Assign risk band
             if avg_dqi < 25:
@@ -6,8 +6,8 @@ Usage:
 """
 
 from django.core.management.base import BaseCommand
-from apps.core.models import Study, Country, Site, Subject
-from apps.monitoring.models import Query, MissingVisit, MissingPage
+from apps.core.models import Study, Country, Site, Subject, StringDict
+from apps.monitoring.models import Query, MissingVisit, MissingPage, AuditEntry
 from apps.metrics.models import (
     DQIScoreStudy, DQIScoreSite, DQIScoreSubject,
     CleanPatientStatus, DQIWeightConfig
@@ -148,6 +148,7 @@ class Command(BaseCommand):
                       'Concomitant Meds', 'ECG Results', 'Physical Exam', 'Medical History']
         form_names = ['DM_Form', 'VS_Form', 'LB_Form', 'AE_Form',
                       'CM_Form', 'EG_Form', 'PE_Form', 'MH_Form']
+        form_ids = StringDict.intern(StringDict.Kind.FORM, form_names)
 
         for site in sites:
             num_subjects = random.randint(12, 16)
@@ -179,20 +180,26 @@ class Command(BaseCommand):
                 if random.random() > 0.35:
                     num_queries = random.randint(1, 8)
                     for q in range(num_queries):
-                        q_status = random.choice(['Open', 'Open', 'Closed', 'Answered'])
-                        if q_status == 'Open':
+                        q_status = random.choice([
+                            Query.QueryStatus.OPEN, Query.QueryStatus.OPEN,
+                            Query.QueryStatus.CLOSED, Query.QueryStatus.ANSWERED,
+                        ])
+                        if q_status == Query.QueryStatus.OPEN:
                             open_q_count += 1
                         q_open_date = (timezone.now() - timezone.timedelta(
                             days=random.randint(1, 90))).date()
-                        Query.objects.create(
+                        query = Query.objects.create(
                             subject=subject,
                             log_number=f'Q{random.randint(1000, 9999)}',
-                            form_name=random.choice(form_names),
+                            form_id=form_ids[random.choice(form_names)],
                             query_status=q_status,
                             query_open_date=q_open_date,
                             days_since_open=random.randint(1, 60),
-                            action_owner=random.choice(['Site', 'CRA', 'DM']),
+                            action_owner=random.choice([
+                                Query.ActionOwner.SITE, Query.ActionOwner.CRA, Query.ActionOwner.DM,
+                            ]),
                         )
+                        AuditEntry.record(query, created_by='create_sample_data')
 
                 # --- Missing Visits ---
                 mv_count = 0
@@ -203,6 +210,7 @@ class Command(BaseCommand):
                         obj, was_created = MissingVisit.objects.get_or_create(
                             subject=subject,
                             visit_name=vname,
+                            is_resolved=False,
                             defaults={
                                 'projected_date': (timezone.now() - timezone.timedelta(
                                     days=random.randint(5, 60))).date(),
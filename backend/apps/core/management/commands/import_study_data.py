@@ -31,11 +31,14 @@ import os
 from pathlib import Path
 from datetime import datetime
 
-from apps.core.models import Study, Country, Site, Subject, Visit, FormPage
-from apps.monitoring.models import Query, SDVStatus, PISignatureStatus, ProtocolDeviation, NonConformantEvent, MissingVisit, MissingPage
+from apps.core.models import Study, Country, Site, Subject, Visit, FormPage, StringDict
+from apps.monitoring.models import Query, SDVStatus, PISignatureStatus, ProtocolDeviation, NonConformantEvent, MissingVisit, MissingPage, AuditEntry
 from apps.safety.models import LabIssue, SAEDiscrepancy
 from apps.medical_coding.models import CodingItem, EDRROpenIssue, InactivatedRecord
 
+# Actor recorded in AuditEntry for the fact rows this command writes
+AUDIT_ACTOR = 'import_study_data'
+
 
 class Command(BaseCommand):
     help = 'Import clinical trial data from Excel files'
@@ -254,6 +257,14 @@ class Command(BaseCommand):
         """Load queries from dataframe."""
         self.stdout.write(f'Loading {len(df)} queries')
 
+        # Intern the form labels up front (batched)
+        form_ids = StringDict.intern(
+            StringDict.Kind.FORM,
+            [str(v) for v in df.get('Form Name', []) if pd.notna(v)] + ['Unknown']
+        )
+
+        # Audit entries are written once for the whole sheet
+        created_ids = []
         for _, row in df.iterrows():
             try:
                 # Find subject
@@ -266,23 +277,34 @@ class Command(BaseCommand):
                 if not subject:
                     continue
 
+                query_status = Query.QueryStatus.parse(row.get('Query Status'))
+                action_owner = Query.ActionOwner.parse(row.get('Action Owner'))
+                if query_status is None or action_owner is None:
+                    label = row.get('Query Status') if query_status is None else row.get('Action Owner')
+                    stats['errors'].append(f'Query row error: unknown query status/owner: {label}')
+                    continue
+
                 # Create query
-                Query.objects.get_or_create(
+                query, created = Query.objects.get_or_create(
                     subject=subject,
                     log_number=str(row.get('Log Number', '')),
                     defaults={
-                        'form_name': row.get('Form Name', ''),
+                        'form_id': form_ids.get(str(row.get('Form Name', '')), form_ids['Unknown']),
                         'field_oid': row.get('Field OID', ''),
-                        'query_status': row.get('Query Status', 'Open'),
-                        'action_owner': row.get('Action Owner', 'Site'),
+                        'query_status': query_status,
+                        'action_owner': action_owner,
                         'query_open_date': pd.to_datetime(row.get('Query Open Date'), errors='coerce') or timezone.now().date(),
                         'days_since_open': int(row.get('Days Since Open', 0))
                     }
                 )
+                if created:
+                    created_ids.append(query.pk)
                 stats['queries'] += 1
             except Exception as e:
                 stats['errors'].append(f'Query row error: {e}')
 
+        AuditEntry.record_loaded(Query, AUDIT_ACTOR, created_ids)
+
     def _load_missing_visits(self, study, file_path, stats):
         """Load missing visits from Visit Projection Tracker."""
         self.stdout.write(f'Loading {file_path.name}')
@@ -304,6 +326,7 @@ class Command(BaseCommand):
                 MissingVisit.objects.get_or_create(
                     subject=subject,
                     visit_name=row.get('Visit Name', 'Unknown'),
+                    is_resolved=False,
                     defaults={
                         'projected_date': pd.to_datetime(row.get('Projected Date'), errors='coerce') or timezone.now().date(),
                         'days_outstanding': int(row.get('Days Outstanding', 0))
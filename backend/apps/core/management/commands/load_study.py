@@ -31,15 +31,18 @@ import logging
 import re
 import json
 
-from apps.core.models import Study, Country, Site, Subject, Visit, FormPage
+from apps.core.models import Study, Country, Site, Subject, Visit, FormPage, StringDict
 from apps.monitoring.models import (
     Query, SDVStatus, PISignatureStatus, ProtocolDeviation,
-    NonConformantEvent, MissingVisit, MissingPage
+    NonConformantEvent, MissingVisit, MissingPage, CRFEvent, AuditEntry
 )
 from apps.safety.models import LabIssue, SAEDiscrepancy
 from apps.medical_coding.models import CodingItem, EDRROpenIssue, InactivatedRecord
 
 
+# Actor recorded in AuditEntry for the fact rows this command writes
+AUDIT_ACTOR = 'load_study'
+
 # Country code to name mapping
 COUNTRY_NAMES = {
     'AUT': 'Austria', 'CHN': 'China', 'CZE': 'Czech Republic',
@@ -244,6 +247,15 @@ class Command(BaseCommand):
         self.stdout.write(f'\n--- Wiping {self.study_id} Data ---')
         self._log_info(f'Wiping {self.study_id} data...')
         
+        # Audit entries are not cascaded from their facts; drop them first
+        for facts in (
+            CRFEvent.objects.filter(study_id=self.study_id),
+            NonConformantEvent.objects.filter(subject__study_id=self.study_id),
+            ProtocolDeviation.objects.filter(study_id=self.study_id),
+            Query.objects.filter(subject__study_id=self.study_id),
+        ):
+            AuditEntry.delete_for(facts.model, facts.values('pk'))
+
         # Delete in FK-safe order
         InactivatedRecord.objects.filter(subject__study_id=self.study_id).delete()
         CodingItem.objects.filter(study_id=self.study_id).delete()
@@ -545,6 +557,19 @@ class Command(BaseCommand):
         if not subj_col:
             return 0
         
+        # Intern the sheet's folder/form labels up front (batched)
+        form_col = 'Form' if 'Form' in df.columns else 'Form Name'
+        folder_ids = StringDict.intern(
+            StringDict.Kind.FOLDER,
+            [self._clean_str(v) for v in df.get('Folder Name', [])]
+        )
+        form_ids = StringDict.intern(
+            StringDict.Kind.FORM,
+            [self._clean_str(v) for v in df.get(form_col, [])] + ['Unknown']
+        )
+        
+        # Audit entries are written once for the whole sheet
+        created_ids, updated_ids = [], []
         for idx, row in df.iterrows():
             try:
                 subject_str = self._clean_str(row.get(subj_col, ''))
@@ -565,31 +590,36 @@ class Command(BaseCommand):
                 query_open_date = pd.to_datetime(row.get('Query Open Date'), errors='coerce')
                 days_since_open = row.get('# Days Since Open', row.get('Days Since Open', 0))
                 
-                # Map action owner
+                # Map status and action owner; unknown labels reject the row
                 owner_map = {'Site Review': 'Site', 'CRA Review': 'CRA', 'DM Review': 'DM'}
-                mapped_owner = owner_map.get(action_owner, action_owner) if action_owner else 'Site'
-                if mapped_owner not in ['Site', 'CRA', 'DM', 'Sponsor']:
-                    mapped_owner = 'Site'
+                mapped_status = Query.QueryStatus.parse(query_status)
+                mapped_owner = Query.ActionOwner.parse(owner_map.get(action_owner, action_owner))
+                if mapped_status is None or mapped_owner is None:
+                    label = query_status if mapped_status is None else action_owner
+                    self._reject_row(sheet_name, idx, f'Unknown query status/owner: {label}', subject_str)
+                    continue
                 
-                Query.objects.update_or_create(
+                query, created = Query.objects.update_or_create(
                     subject=subject,
                     log_number=log_number,
                     field_oid=field_oid if field_oid else None,
                     defaults={
-                        'folder_name': folder_name if folder_name else None,
-                        'form_name': form_name if form_name else 'Unknown',
-                        'query_status': query_status if query_status else 'Open',
+                        'folder_id': folder_ids.get(folder_name),
+                        'form_id': form_ids[form_name or 'Unknown'],
+                        'query_status': mapped_status,
                         'action_owner': mapped_owner,
                         'query_open_date': query_open_date.date() if pd.notna(query_open_date) else timezone.now().date(),
                         'visit_date': visit_date.date() if pd.notna(visit_date) else None,
                         'days_since_open': int(days_since_open) if pd.notna(days_since_open) else 0,
                     }
                 )
+                (created_ids if created else updated_ids).append(query.pk)
                 count += 1
                 
             except Exception as e:
                 self._reject_row(sheet_name, idx, str(e), subject_str if 'subject_str' in dir() else 'N/A')
         
+        AuditEntry.record_loaded(Query, AUDIT_ACTOR, created_ids, updated_ids)
         return count
 
     def _load_sdv(self, file_path):
@@ -707,6 +737,7 @@ class Command(BaseCommand):
             
             df = pd.read_excel(file_path, sheet_name='Protocol Deviation')
             count = 0
+            created_ids = []
             
             subj_col = None
             for col in ['Subject Name', 'Subject', 'Subject ID']:
@@ -730,18 +761,20 @@ class Command(BaseCommand):
                     status = self._clean_str(row.get('PD Status', 'Open'))
                     visit_date = pd.to_datetime(row.get('Visit date', row.get('Visit Date')), errors='coerce')
                     
-                    ProtocolDeviation.objects.create(
+                    deviation = ProtocolDeviation.objects.create(
                         study=self.study,
                         subject=subject,
                         deviation_type='Protocol Deviation',
                         status=status if status else 'Open',
                         deviation_date=visit_date.date() if pd.notna(visit_date) else timezone.now().date()
                     )
+                    created_ids.append(deviation.pk)
                     count += 1
                     
                 except Exception as e:
                     self._reject_row('Protocol Deviation', idx, str(e), '')
             
+            AuditEntry.record_loaded(ProtocolDeviation, AUDIT_ACTOR, created_ids)
             self.stats['protocol_deviations'] = count
             self.stdout.write(self.style.SUCCESS(f'  Loaded {count} Protocol Deviations'))
             
@@ -759,6 +792,7 @@ class Command(BaseCommand):
             
             df = pd.read_excel(file_path, sheet_name='Non conformant')
             count = 0
+            created_ids = []
             
             subj_col = None
             for col in ['Subject Name', 'Subject', 'Subject ID']:
@@ -802,7 +836,7 @@ class Command(BaseCommand):
                     
                     audit_time = pd.to_datetime(row.get('Audit Time'), errors='coerce')
                     
-                    NonConformantEvent.objects.create(
+                    event = NonConformantEvent.objects.create(
                         page=page,
                         subject=subject,
                         issue_type='Non-conformant Data',
@@ -810,11 +844,13 @@ class Command(BaseCommand):
                         status='Open',
                         detected_date=audit_time.date() if pd.notna(audit_time) else timezone.now().date()
                     )
+                    created_ids.append(event.pk)
                     count += 1
                     
                 except Exception as e:
                     self._reject_row('Non conformant', idx, str(e), '')
             
+            AuditEntry.record_loaded(NonConformantEvent, AUDIT_ACTOR, created_ids)
             self.stats['nonconformant_events'] = count
             self.stdout.write(self.style.SUCCESS(f'  Loaded {count} Non-conformant events'))
             
@@ -1197,6 +1233,7 @@ class Command(BaseCommand):
                     MissingVisit.objects.update_or_create(
                         subject=subject,
                         visit_name=self._clean_str(row.get('Visit', 'Unknown')),
+                        is_resolved=False,
                         defaults={
                             'projected_date': projected_date.date() if pd.notna(projected_date) else timezone.now().date(),
                             'days_outstanding': int(days_outstanding) if pd.notna(days_outstanding) else 0
@@ -49,15 +49,18 @@ from datetime import datetime
 import logging
 import re
 
-from apps.core.models import Study, Country, Site, Subject, Visit, FormPage
+from apps.core.models import Study, Country, Site, Subject, Visit, FormPage, StringDict
 from apps.monitoring.models import (
-    Query, SDVStatus, PISignatureStatus, ProtocolDeviation, 
-    NonConformantEvent, MissingVisit, MissingPage
+    Query, SDVStatus, PISignatureStatus, ProtocolDeviation,
+    NonConformantEvent, MissingVisit, MissingPage, CRFEvent, AuditEntry
 )
 from apps.safety.models import LabIssue, SAEDiscrepancy
 from apps.medical_coding.models import CodingItem, EDRROpenIssue, InactivatedRecord
 
 
+# Actor recorded in AuditEntry for the fact rows this command writes
+AUDIT_ACTOR = 'load_study1'
+
 # Country code to name mapping (pycountry fallback)
 COUNTRY_NAMES = {
     'AUT': 'Austria', 'CHN': 'China', 'CZE': 'Czech Republic',
@@ -291,6 +294,15 @@ These files should be in the original Novartis dataset folder:
         
         study_id = 'Study_1'
         
+        # Audit entries are not cascaded from their facts; drop them first
+        for facts in (
+            CRFEvent.objects.filter(study_id=study_id),
+            NonConformantEvent.objects.filter(subject__study_id=study_id),
+            ProtocolDeviation.objects.filter(study_id=study_id),
+            Query.objects.filter(subject__study_id=study_id),
+        ):
+            AuditEntry.delete_for(facts.model, facts.values('pk'))
+
         # Delete in FK-safe order (children before parents)
         # Fact tables first
         InactivatedRecord.objects.filter(subject__study_id=study_id).delete()
@@ -666,6 +678,18 @@ These files should be in the original Novartis dataset folder:
         """Load queries from a single sheet."""
         count = 0
         
+        # Intern the sheet's folder/form labels up front (batched)
+        folder_ids = StringDict.intern(
+            StringDict.Kind.FOLDER,
+            [str(v) for v in df.get('Folder Name', []) if str(v) != 'nan']
+        )
+        form_ids = StringDict.intern(
+            StringDict.Kind.FORM,
+            [str(v) for v in df.get('Form', []) if str(v) != 'nan'] + ['Unknown']
+        )
+        
+        # Audit entries are written once for the whole sheet
+        created_ids, updated_ids = [], []
         for idx, row in df.iterrows():
             try:
                 # Find subject
@@ -694,26 +718,34 @@ These files should be in the original Novartis dataset folder:
                 
                 # Map action owner
                 action_owner_map = {
-                    'Site Review': 'Site',
-                    'Site': 'Site',
-                    'CRA': 'CRA',
-                    'CRA Review': 'CRA',
-                    'DM': 'DM',
-                    'Sponsor': 'Sponsor',
+                    'Site Review': Query.ActionOwner.SITE,
+                    'Site': Query.ActionOwner.SITE,
+                    'CRA': Query.ActionOwner.CRA,
+                    'CRA Review': Query.ActionOwner.CRA,
+                    'DM': Query.ActionOwner.DM,
+                    'DM Review': Query.ActionOwner.DM,
+                    'Data Management': Query.ActionOwner.DM,
+                    'Sponsor': Query.ActionOwner.SPONSOR,
                 }
-                mapped_owner = action_owner_map.get(action_owner, 'Site')
+                mapped_owner = action_owner_map.get(action_owner)
+                mapped_status = Query.QueryStatus.parse(query_status)
+                if mapped_status is None or mapped_owner is None:
+                    # Unknown labels reject the row rather than default to Open/Site
+                    label = query_status if mapped_status is None else action_owner
+                    self._reject_row(sheet_name, idx, f'Unknown query status/owner: {label}')
+                    continue
                 
                 # Create unique query ID
                 query_key = f"{subject.subject_id}_{log_number}_{field_oid}"
                 
-                Query.objects.update_or_create(
+                query, created = Query.objects.update_or_create(
                     subject=subject,
                     log_number=log_number,
                     field_oid=field_oid if field_oid != 'nan' else None,
                     defaults={
-                        'folder_name': folder_name if folder_name != 'nan' else None,
-                        'form_name': form_name if form_name != 'nan' else 'Unknown',
-                        'query_status': query_status if query_status != 'nan' else 'Open',
+                        'folder_id': folder_ids.get(folder_name),
+                        'form_id': form_ids[form_name if form_name not in ('', 'nan') else 'Unknown'],
+                        'query_status': mapped_status,
                         'action_owner': mapped_owner,
                         'marking_group_name': marking_group if marking_group != 'nan' else None,
                         'query_open_date': query_open_date.date() if pd.notna(query_open_date) else timezone.now().date(),
@@ -723,11 +755,13 @@ These files should be in the original Novartis dataset folder:
                         'days_since_response': int(days_since_response) if pd.notna(days_since_response) else None,
                     }
                 )
+                (created_ids if created else updated_ids).append(query.pk)
                 count += 1
                 
             except Exception as e:
                 self._reject_row(sheet_name, idx, str(e))
         
+        AuditEntry.record_loaded(Query, AUDIT_ACTOR, created_ids, updated_ids)
         return count
 
     # =========================================================================
@@ -835,6 +869,7 @@ These files should be in the original Novartis dataset folder:
         try:
             df = pd.read_excel(file_path, sheet_name='Protocol Deviation')
             count = 0
+            created_ids = []
             
             for idx, row in df.iterrows():
                 try:
@@ -849,18 +884,20 @@ These files should be in the original Novartis dataset folder:
                     status = str(row.get('PD Status', 'Open'))
                     visit_date = pd.to_datetime(row.get('Visit date'), errors='coerce')
                     
-                    ProtocolDeviation.objects.create(
+                    deviation = ProtocolDeviation.objects.create(
                         study=self.study,
                         subject=subject,
                         deviation_type='Protocol Deviation',
                         status=status if status != 'nan' else 'Open',
                         deviation_date=visit_date.date() if pd.notna(visit_date) else timezone.now().date()
                     )
+                    created_ids.append(deviation.pk)
                     count += 1
                     
                 except Exception as e:
                     self._reject_row('Protocol Deviation', idx, str(e))
             
+            AuditEntry.record_loaded(ProtocolDeviation, AUDIT_ACTOR, created_ids)
             self.stats['protocol_deviations'] = count
             self.stdout.write(self.style.SUCCESS(f'  Loaded {count} Protocol Deviations'))
             
@@ -878,6 +915,7 @@ These files should be in the original Novartis dataset folder:
         try:
             df = pd.read_excel(file_path, sheet_name='Non conformant')
             count = 0
+            created_ids = []
             
             for idx, row in df.iterrows():
                 try:
@@ -916,7 +954,7 @@ These files should be in the original Novartis dataset folder:
                     
                     audit_time = pd.to_datetime(row.get('Audit Time'), errors='coerce')
                     
-                    NonConformantEvent.objects.create(
+                    event = NonConformantEvent.objects.create(
                         page=page,
                         subject=subject,
                         issue_type='Non-conformant Data',
@@ -924,11 +962,13 @@ These files should be in the original Novartis dataset folder:
                         status='Open',
                         detected_date=audit_time.date() if pd.notna(audit_time) else timezone.now().date()
                     )
+                    created_ids.append(event.pk)
                     count += 1
                     
                 except Exception as e:
                     self._reject_row('Non conformant', idx, str(e))
             
+            AuditEntry.record_loaded(NonConformantEvent, AUDIT_ACTOR, created_ids)
             self.stats['nonconformant_events'] = count
             self.stdout.write(self.style.SUCCESS(f'  Loaded {count} Non-conformant events'))
             
@@ -1209,6 +1249,7 @@ These files should be in the original Novartis dataset folder:
                     MissingVisit.objects.update_or_create(
                         subject=subject,
                         visit_name=str(row.get('Visit', 'Unknown')),
+                        is_resolved=False,
                         defaults={
                             'projected_date': projected_date.date() if pd.notna(projected_date) else timezone.now().date(),
                             'days_outstanding': int(days_outstanding) if pd.notna(days_outstanding) else 0
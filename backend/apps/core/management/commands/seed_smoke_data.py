@@ -10,8 +10,8 @@ Usage:
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
-from apps.core.models import Study, Country, Site, Subject, Visit, FormPage
-from apps.monitoring.models import Query, OpenIssueSummary, MissingVisit
+from apps.core.models import Study, Country, Site, Subject, Visit, FormPage, StringDict
+from apps.monitoring.models import Query, OpenIssueSummary, MissingVisit, AuditEntry
 from apps.safety.models import SAEDiscrepancy
 from apps.metrics.models import CleanPatientStatus, DQIScoreSubject
 
@@ -101,11 +101,13 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'  FormPage: {form_page.form_name}'))
 
         # 7. Query
-        query, _ = Query.objects.update_or_create(
+        folder_ids = StringDict.intern(StringDict.Kind.FOLDER, ['SCREENING'])
+        form_ids = StringDict.intern(StringDict.Kind.FORM, ['Demographics'])
+        query, created = Query.objects.update_or_create(
             study=study,
             site=site,
             subject=subject,
-            form_name='Demographics',
+            form_id=form_ids['Demographics'],
             field_oid='DM.0001',
             log_number='Q-001',
             defaults={
@@ -114,14 +116,18 @@ class Command(BaseCommand):
                 'region': country.region,
                 'country_code': country.country_code,
                 'site_number': site.site_number,
-                'folder_name': 'SCREENING',
-                'query_status': 'Open',
-                'action_owner': 'Site',
+                'folder_id': folder_ids['SCREENING'],
+                'query_status': Query.QueryStatus.OPEN,
+                'action_owner': Query.ActionOwner.SITE,
                 'query_open_date': today - timedelta(days=5),
                 'visit_date': visit.visit_date,
                 'days_since_open': 5,
             }
         )
+        if created:
+            AuditEntry.record(query, created_by='seed_smoke_data')
+        else:
+            AuditEntry.record(query, updated_by='seed_smoke_data')
         self.stdout.write(self.style.SUCCESS(f'  Query: {query.log_number}'))
 
         # 8. OpenIssueSummary
@@ -140,12 +146,12 @@ class Command(BaseCommand):
         missing_visit, _ = MissingVisit.objects.update_or_create(
             subject=subject,
             visit_name='Week 4',
+            is_resolved=False,
             defaults={
                 'study': study,
                 'site': site,
                 'projected_date': today - timedelta(days=7),
                 'days_outstanding': 7,
-                'is_resolved': False,
             }
         )
         self.stdout.write(self.style.SUCCESS(f'  MissingVisit: {missing_visit.visit_name}'))
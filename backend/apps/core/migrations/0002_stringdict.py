@@ -0,0 +1,30 @@
+# Generated by Django 5.0 on 2026-10-16 04:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StringDict',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('kind', models.SmallIntegerField(choices=[(1, 'Folder'), (2, 'Form')], help_text='Which EDC label family this value belongs to')),
+                ('value', models.CharField(help_text='Label text as it appears in the EDC export', max_length=200)),
+            ],
+            options={
+                'verbose_name': 'String Dictionary Entry',
+                'verbose_name_plural': 'String Dictionary',
+                'db_table': 'dim_string_dict',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='stringdict',
+            constraint=models.UniqueConstraint(fields=('kind', 'value'), name='uq_string_dict_kind_value'),
+        ),
+    ]
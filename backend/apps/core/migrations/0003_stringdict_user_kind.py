@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-16 04:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_stringdict'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='stringdict',
+            name='kind',
+            field=models.SmallIntegerField(choices=[(1, 'Folder'), (2, 'Form'), (3, 'User')], help_text='Which EDC label family this value belongs to'),
+        ),
+    ]
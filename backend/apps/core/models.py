@@ -13,6 +13,7 @@ Models:
 - DIM_SUBJECT
 - DIM_VISIT
 - DIM_FORM_PAGE
+- DIM_STRING_DICT
 
 Reference: NEST2 Project Document Section 7.3, Backend Architecture Diagram
 """
@@ -602,3 +603,74 @@ class FormPage(models.Model):
         if self.page_name:
             return f"{self.form_name} - {self.page_name}"
         return self.form_name
+
+
+class StringDict(models.Model):
+    """
+    DIM_STRING_DICT - Interned EDC labels shared by the fact tables.
+
+    Architecture Integration:
+    - Fact tables (e.g. FACT_QUERY_EVENT) reference a label by its integer id
+      instead of repeating the same folder/form string on every row
+    - FACT_AUDIT_ENTRY references user/service names the same way
+    - Only a few hundred distinct labels exist per study, so the dictionary
+      stays small while the fact rows get narrower (more rows per page)
+
+    Business Rules:
+    - Natural grain: one row per (kind, value)
+    - Labels are immutable once interned; loaders look them up or insert
+      them in batches via StringDict.intern()
+    """
+
+    class Kind(models.IntegerChoices):
+        FOLDER = 1, 'Folder'
+        FORM = 2, 'Form'
+        USER = 3, 'User'
+
+    INTERN_BATCH_SIZE = 500
+
+    id = models.AutoField(primary_key=True)
+    kind = models.SmallIntegerField(
+        choices=Kind.choices,
+        help_text="Which EDC label family this value belongs to"
+    )
+    value = models.CharField(
+        max_length=200,
+        help_text="Label text as it appears in the EDC export"
+    )
+
+    class Meta:
+        db_table = 'dim_string_dict'
+        verbose_name = 'String Dictionary Entry'
+        verbose_name_plural = 'String Dictionary'
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'value'], name='uq_string_dict_kind_value'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.value}"
+
+    @classmethod
+    def intern(cls, kind, values):
+        """
+        Look up or insert labels of one kind.
+
+        Returns a {value: id} mapping for every non-empty value. Values are
+        resolved INTERN_BATCH_SIZE at a time: existing ids are read first and
+        only the missing labels are inserted (ON CONFLICT DO NOTHING, so
+        concurrent loaders interning the same label do not collide).
+        """
+        wanted = list(dict.fromkeys(v for v in values if v))
+        ids = {}
+        for start in range(0, len(wanted), cls.INTERN_BATCH_SIZE):
+            batch = wanted[start:start + cls.INTERN_BATCH_SIZE]
+            found = dict(cls.objects.filter(kind=kind, value__in=batch).values_list('value', 'id'))
+            missing = [v for v in batch if v not in found]
+            if missing:
+                cls.objects.bulk_create(
+                    [cls(kind=kind, value=v) for v in missing],
+                    ignore_conflicts=True
+                )
+                found.update(cls.objects.filter(kind=kind, value__in=missing).values_list('value', 'id'))
+            ids.update(found)
+        return ids
@@ -3,9 +3,19 @@ Views for core app.
 Handles main dashboards and navigation.
 """
 
+import json
+
 from django.shortcuts import render
 from django.http import HttpResponse
 
+# Static health check response, serialized once at import; config.wsgi
+# also answers it directly.
+HEALTH_CHECK_BODY = json.dumps({
+    'status': 'ok',
+    'service': 'Clinical Trial Control Tower',
+    'version': '1.0.0'
+}).encode()
+
 
 def home(request):
     """
@@ -17,6 +27,20 @@ def home(request):
     return HttpResponse("Clinical Trial Control Tower - Phase 0 Setup Complete")
 
 
+def health_check(request):
+    """
+    Health check endpoint for monitoring and load balancers.
+    
+    Purpose: Returns a simple JSON response indicating the server is running.
+    Inputs: HTTP GET request (no parameters required)
+    Outputs: JSON object with status='ok' and HTTP 200
+    Side effects: None (read-only operation)
+    
+    Usage: GET /health/
+    """
+    return HttpResponse(HEALTH_CHECK_BODY, content_type='application/json')
+
+
 # Additional views will be implemented in Phase 1/4:
 # - cra_dashboard
 # - dqt_dashboard
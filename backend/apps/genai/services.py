@@ -139,7 +139,7 @@ class ClinicalTrialAIService:
         Returns a helpful fallback message when AI is not configured.
         """
         try:
-            query = Query.objects.select_related('subject').get(query_id=query_id)
+            query = Query.objects.select_related('subject', 'form').get(query_id=query_id)
         except Exception:
             return {"error": "Query not found"}
 
@@ -258,7 +258,7 @@ class ClinicalTrialAIService:
         # Count critical issues
         open_queries = Query.objects.filter(
             subject__study_id=study_id,
-            query_status='Open'
+            query_status=Query.QueryStatus.OPEN
         ).count()
 
         missing_visits = MissingVisit.objects.filter(
@@ -396,7 +396,7 @@ Keep response concise (under 250 words) and actionable for CRAs.
             'subject_id': query.subject.subject_external_id,
             'site_number': query.subject.site.site_number,
             'days_open': query.days_since_open,
-            'action_owner': query.action_owner
+            'action_owner': query.get_action_owner_display()
         }
 
     def _gather_subject_evidence(self, subject, clean_status, dqi_score):
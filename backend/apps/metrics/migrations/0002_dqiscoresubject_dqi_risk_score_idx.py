@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-16 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metrics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dqiscoresubject',
+            index=models.Index(fields=['risk_band', 'composite_dqi_score'], name='dqi_risk_score_idx'),
+        ),
+    ]
@@ -176,6 +176,10 @@ class DQIScoreSubject(models.Model):
         db_table = 'mart_dqi_score_subject'
         verbose_name = 'DQI Score (Subject)'
         verbose_name_plural = 'DQI Scores (Subject)'
+        indexes = [
+            # Worst-first listing of High/Critical subjects (batch risk predictions)
+            models.Index(fields=['risk_band', 'composite_dqi_score'], name='dqi_risk_score_idx'),
+        ]
 
 
 class DQIScoreSite(models.Model):
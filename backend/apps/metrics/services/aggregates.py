@@ -0,0 +1,40 @@
+"""
+Database-side count helpers for dashboard and metrics rollups.
+
+Architecture Integration:
+- Used by the KPI + Analytics Service (compute_metrics) and the dashboard
+  API to count related fact rows per subject/site in the same SELECT
+- Each count is a correlated subquery, so several counts over different
+  fact tables can be annotated together without the row multiplication
+  of stacking Count() joins
+"""
+
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_subquery(queryset, outer_field):
+    """
+    Annotation expression counting `queryset` rows that point at the outer row.
+
+    Args:
+        queryset: Filtered fact queryset, e.g. Query.objects.filter(query_status=...)
+        outer_field: Lookup on the fact model that references the outer
+                     row's primary key, e.g. 'subject' or 'subject__site'
+
+    Returns:
+        Expression yielding the count, or 0 when no rows match.
+
+    Usage:
+        Subject.objects.annotate(
+            open_queries=count_subquery(Query.objects.filter(query_status=...), 'subject')
+        )
+    """
+    counts = (
+        queryset.filter(**{outer_field: OuterRef('pk')})
+        .order_by()
+        .values(outer_field)
+        .annotate(total=Count('*'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
@@ -5,10 +5,28 @@ Django admin configuration for monitoring models.
 from django.contrib import admin
 from .models import (
     OpenIssueSummary, CRFEvent, Query, SDVStatus, PISignatureStatus,
-    ProtocolDeviation, NonConformantEvent, MissingVisit, MissingPage
+    ProtocolDeviation, NonConformantEvent, MissingVisit, MissingPage, AuditEntry
 )
 
 
+class DeferLongTextMixin:
+    """
+    Leave long free-text columns out of changelist queries.
+
+    Only the changelist defers them: the change form renders every field,
+    and a deferred field would cost it one extra query per field.
+    """
+
+    deferred_fields = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if self.deferred_fields and match and (match.url_name or '').endswith('_changelist'):
+            return queryset.defer(*self.deferred_fields)
+        return queryset
+
+
 @admin.register(OpenIssueSummary)
 class OpenIssueSummaryAdmin(admin.ModelAdmin):
     list_display = ['id', 'study', 'subject', 'total_open_issue_count', 'updated_at']
@@ -25,11 +43,13 @@ class CRFEventAdmin(admin.ModelAdmin):
 
 
 @admin.register(Query)
-class QueryAdmin(admin.ModelAdmin):
-    list_display = ['query_id', 'subject', 'query_status', 'action_owner', 'query_open_date', 'form_name']
+class QueryAdmin(DeferLongTextMixin, admin.ModelAdmin):
+    list_display = ['query_id', 'subject', 'query_status', 'action_owner', 'query_open_date', 'form']
     list_filter = ['query_status', 'action_owner', 'study', 'site']
-    search_fields = ['log_number', 'subject__subject_external_id', 'form_name']
+    search_fields = ['log_number', 'subject__subject_external_id', 'form__value']
+    list_select_related = ['subject', 'form']
     ordering = ['-query_open_date']
+    deferred_fields = ['suggested_response']
 
 
 @admin.register(SDVStatus)
@@ -47,17 +67,19 @@ class PISignatureStatusAdmin(admin.ModelAdmin):
 
 
 @admin.register(ProtocolDeviation)
-class ProtocolDeviationAdmin(admin.ModelAdmin):
+class ProtocolDeviationAdmin(DeferLongTextMixin, admin.ModelAdmin):
     list_display = ['deviation_id', 'subject', 'deviation_type', 'severity', 'status']
     list_filter = ['status', 'severity', 'study']
     search_fields = ['subject__subject_external_id', 'deviation_type']
+    deferred_fields = ['description', 'ai_severity_assessment']
 
 
 @admin.register(NonConformantEvent)
-class NonConformantEventAdmin(admin.ModelAdmin):
+class NonConformantEventAdmin(DeferLongTextMixin, admin.ModelAdmin):
     list_display = ['event_id', 'subject', 'issue_type', 'severity', 'status', 'detected_date']
     list_filter = ['severity', 'status']
     search_fields = ['subject__subject_external_id', 'issue_type']
+    deferred_fields = ['description']
 
 
 
@@ -76,3 +98,10 @@ class MissingPageAdmin(admin.ModelAdmin):
     search_fields = ['subject__subject_external_id', 'visit_name', 'page_name']
     ordering = ['-days_missing']
 
+
+@admin.register(AuditEntry)
+class AuditEntryAdmin(admin.ModelAdmin):
+    list_display = ['id', 'content_type', 'object_id', 'created_by', 'updated_by', 'resolved_by', 'resolved_at']
+    list_filter = ['content_type']
+    list_select_related = ['content_type', 'created_by', 'updated_by', 'resolved_by']
+    raw_id_fields = ['created_by', 'updated_by', 'resolved_by']
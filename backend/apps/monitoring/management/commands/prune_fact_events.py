@@ -0,0 +1,78 @@
+"""
+Management command to apply retention to the high-volume monitoring fact tables.
+
+Usage:
+    python manage.py prune_fact_events --before 2023-01-01 [--batch-size 5000] [--dry-run]
+
+Deletes Query rows opened before the cutoff and CRF events that occurred
+before it. Rows are removed in primary-key batches selected by the date
+column, so each batch is a short transaction driven by the BRIN date index
+instead of one long DELETE that bloats the table and WAL. Each batch's
+AuditEntry rows are deleted with it.
+"""
+
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.monitoring.models import AuditEntry, CRFEvent, Query
+
+
+class Command(BaseCommand):
+    help = 'Delete monitoring fact rows older than a retention cutoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--before',
+            type=str,
+            required=True,
+            help='Cutoff date (YYYY-MM-DD); rows dated before it are deleted'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows deleted per transaction (default: 5000)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many rows would be deleted'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            cutoff = datetime.strptime(options['before'], '%Y-%m-%d').date()
+        except ValueError:
+            raise CommandError('--before must be a date in YYYY-MM-DD format')
+
+        batch_size = max(1, options['batch_size'])
+        cutoff_time = timezone.make_aware(datetime.combine(cutoff, time.min))
+
+        targets = [
+            ('Queries', Query.objects.filter(query_open_date__lt=cutoff)),
+            ('CRF Events', CRFEvent.objects.filter(event_time__lt=cutoff_time)),
+        ]
+
+        for label, queryset in targets:
+            if options['dry_run']:
+                self.stdout.write(f'{label}: {queryset.count()} row(s) would be deleted')
+                continue
+
+            deleted = self._delete_in_batches(queryset, batch_size)
+            self.stdout.write(self.style.SUCCESS(f'{label}: {deleted} row(s) deleted'))
+
+    def _delete_in_batches(self, queryset, batch_size):
+        """Delete the queryset batch by batch; returns the number of rows removed."""
+        model = queryset.model
+        total = 0
+        while True:
+            pks = list(queryset.order_by().values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                return total
+            with transaction.atomic():
+                AuditEntry.delete_for(model, pks)
+                model.objects.filter(pk__in=pks).delete()
+            total += len(pks)
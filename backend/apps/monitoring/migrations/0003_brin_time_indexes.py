@@ -0,0 +1,43 @@
+# BRIN indexes for the append-only monitoring fact tables.
+#
+# Rows in these tables arrive in roughly chronological order, so a BRIN
+# index over the event/open date covers date-range scans at a fraction of
+# the size of a B-tree. BRIN is PostgreSQL-only; on other backends (SQLite
+# in development) this migration is a no-op.
+
+from django.db import migrations
+
+BRIN_INDEXES = [
+    ('fact_crf_event', 'event_time', 'fact_crf_event_time_brin'),
+    ('fact_query_event', 'query_open_date', 'fact_query_open_date_brin'),
+    ('fact_missing_page', 'visit_date', 'fact_missing_page_visit_brin'),
+    ('fact_nonconformant_event', 'detected_date', 'fact_nonconf_detected_brin'),
+]
+
+
+def create_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, column, name in BRIN_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" '
+            f'USING brin ("{column}") WITH (pages_per_range = 32)'
+        )
+
+
+def drop_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _table, _column, name in BRIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0002_crfevent_openissuesummary_missingpage_is_resolved_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_indexes, drop_brin_indexes),
+    ]
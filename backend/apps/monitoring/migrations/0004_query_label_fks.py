@@ -0,0 +1,35 @@
+# First of three migrations that move Query.folder_name / Query.form_name
+# into the shared DIM_STRING_DICT table: add the nullable integer FKs and
+# relax form_name. The labels are copied in 0005 and the string columns
+# dropped in 0006. The steps are kept apart because on PostgreSQL the
+# deferred FK checks queued by the 0005 UPDATEs would block an ALTER
+# TABLE in the same transaction ("pending trigger events").
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_stringdict'),
+        ('monitoring', '0003_brin_time_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='query',
+            name='folder',
+            field=models.ForeignKey(blank=True, help_text='EDC folder name', limit_choices_to={'kind': 1}, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.stringdict'),
+        ),
+        migrations.AddField(
+            model_name='query',
+            name='form',
+            field=models.ForeignKey(help_text='EDC form name where query exists', limit_choices_to={'kind': 2}, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.stringdict'),
+        ),
+        migrations.AlterField(
+            model_name='query',
+            name='form_name',
+            field=models.CharField(blank=True, help_text='EDC form name where query exists', max_length=200, null=True),
+        ),
+    ]
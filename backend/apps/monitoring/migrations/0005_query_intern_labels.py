@@ -0,0 +1,67 @@
+# Populate the Query folder/form FKs added in 0004 from the old string
+# columns. Data only, and non-atomic: on PostgreSQL each statement commits
+# on its own, so no deferred FK check queued by the UPDATEs is still
+# pending when 0006 alters the table.
+
+from django.db import migrations, models
+
+FOLDER, FORM = 1, 2
+LABELS = [
+    (FOLDER, 'folder_name', 'folder_id'),
+    (FORM, 'form_name', 'form_id'),
+]
+
+
+def intern_labels(apps, schema_editor):
+    StringDict = apps.get_model('core', 'StringDict')
+    Query = apps.get_model('monitoring', 'Query')
+
+    # Queries without a form label get the same placeholder the loaders use
+    Query.objects.filter(models.Q(form_name__isnull=True) | models.Q(form_name='')).update(form_name='Unknown')
+
+    for kind, column, fk_column in LABELS:
+        values = list(
+            Query.objects.exclude(**{f'{column}__isnull': True})
+            .exclude(**{column: ''})
+            .order_by()
+            .values_list(column, flat=True)
+            .distinct()
+        )
+        StringDict.objects.bulk_create(
+            [StringDict(kind=kind, value=value) for value in values],
+            batch_size=500,
+            ignore_conflicts=True
+        )
+        # One UPDATE for the whole table rather than one per label, so the
+        # query table is scanned once per column whatever the label count
+        Query.objects.exclude(**{f'{column}__isnull': True}).update(**{
+            fk_column: models.Subquery(
+                StringDict.objects.filter(kind=kind, value=models.OuterRef(column)).values('id')[:1]
+            )
+        })
+
+
+def restore_labels(apps, schema_editor):
+    StringDict = apps.get_model('core', 'StringDict')
+    Query = apps.get_model('monitoring', 'Query')
+
+    for kind, column, fk_column in LABELS:
+        Query.objects.exclude(**{f'{fk_column}__isnull': True}).update(**{
+            column: models.Subquery(
+                StringDict.objects.filter(pk=models.OuterRef(fk_column)).values('value')[:1]
+            )
+        })
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0002_stringdict'),
+        ('monitoring', '0004_query_label_fks'),
+    ]
+
+    operations = [
+        migrations.RunPython(intern_labels, restore_labels),
+    ]
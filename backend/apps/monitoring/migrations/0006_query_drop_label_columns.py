@@ -0,0 +1,29 @@
+# Drop the Query label string columns copied into DIM_STRING_DICT by 0005
+# and make the form FK mandatory.
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_stringdict'),
+        ('monitoring', '0005_query_intern_labels'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='query',
+            name='folder_name',
+        ),
+        migrations.RemoveField(
+            model_name='query',
+            name='form_name',
+        ),
+        migrations.AlterField(
+            model_name='query',
+            name='form',
+            field=models.ForeignKey(help_text='EDC form name where query exists', limit_choices_to={'kind': 2}, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.stringdict'),
+        ),
+    ]
@@ -0,0 +1,140 @@
+# Store CRFEvent.event_type, Query.query_status and Query.action_owner as
+# SMALLINT codes (IntegerChoices) instead of free-text CharFields.
+#
+# A direct AlterField would emit "USING column::smallint" on PostgreSQL,
+# which fails on the existing labels, so each column is rebuilt: add a
+# nullable *_code column, translate the labels, drop the text column and
+# rename the code column into place. The text columns are made nullable
+# first so the migration can be reversed. The composite indexes over these
+# columns are dropped first and recreated on the new columns.
+
+from django.db import migrations, models
+
+CODES = {
+    ('crfevent', 'event_type'): {
+        'freeze': 1, 'unfreeze': 2, 'lock': 3, 'unlock': 4, 'sign': 5, 'unsign': 6,
+    },
+    ('query', 'query_status'): {
+        'open': 1, 'answered': 2, 'closed': 3, 'cancelled': 4,
+    },
+    ('query', 'action_owner'): {
+        'site': 1, 'site review': 1, 'cra': 2, 'cra review': 2,
+        'dm': 3, 'dm review': 3, 'data management': 3, 'sponsor': 4,
+    },
+}
+
+# Spelling written back when the migration is reversed
+LEGACY_LABELS = {
+    ('crfevent', 'event_type'): {
+        1: 'freeze', 2: 'unfreeze', 3: 'lock', 4: 'unlock', 5: 'sign', 6: 'unsign',
+    },
+    ('query', 'query_status'): {1: 'Open', 2: 'Answered', 3: 'Closed', 4: 'Cancelled'},
+    ('query', 'action_owner'): {1: 'Site', 2: 'CRA', 3: 'DM', 4: 'Sponsor'},
+}
+
+def _unmapped(labels, codes):
+    return sorted(repr(label) for label in labels if str(label or '').strip().lower() not in codes)
+
+
+def labels_to_codes(apps, schema_editor):
+    # Refuse to guess: a label with no code stops the migration and is
+    # listed, so it can be corrected in the data before migrating again
+    found, unmapped = {}, []
+    for (model_name, field), codes in CODES.items():
+        model = apps.get_model('monitoring', model_name)
+        found[model_name, field] = list(model.objects.order_by().values_list(field, flat=True).distinct())
+        unknown = _unmapped(found[model_name, field], codes)
+        if unknown:
+            unmapped.append(f"{model_name}.{field}: {', '.join(unknown)}")
+    if unmapped:
+        raise ValueError('Unrecognised status labels, no code to migrate them to: ' + '; '.join(unmapped))
+
+    for (model_name, field), codes in CODES.items():
+        model = apps.get_model('monitoring', model_name)
+        for label in found[model_name, field]:
+            code = codes[label.strip().lower()]
+            model.objects.filter(**{field: label}).update(**{f'{field}_code': code})
+
+
+def codes_to_labels(apps, schema_editor):
+    for (model_name, field), labels in LEGACY_LABELS.items():
+        model = apps.get_model('monitoring', model_name)
+        for code, label in labels.items():
+            model.objects.filter(**{f'{field}_code': code}).update(**{field: label})
+
+
+def code_field(field_name, required):
+    return models.SmallIntegerField(null=not required, choices=CHOICES[field_name], help_text=HELP[field_name])
+
+
+CHOICES = {
+    'event_type': [(1, 'Freeze'), (2, 'Unfreeze'), (3, 'Lock'), (4, 'Unlock'), (5, 'Sign'), (6, 'Unsign')],
+    'query_status': [(1, 'Open'), (2, 'Answered'), (3, 'Closed'), (4, 'Cancelled')],
+    'action_owner': [(1, 'Site'), (2, 'CRA'), (3, 'Data Management'), (4, 'Sponsor')],
+}
+
+HELP = {
+    'event_type': 'Type of CRF event',
+    'query_status': 'Current query status',
+    'action_owner': 'Who is responsible for resolving this query',
+}
+
+LEGACY_MAX_LENGTH = {'event_type': 20, 'query_status': 50, 'action_owner': 100}
+
+INDEXES = [
+    ('crfevent', ['study', 'event_type'], 'fact_crf_ev_study_i_5b27ce_idx'),
+    ('query', ['study', 'query_status'], 'fact_query__study_i_70298a_idx'),
+    ('query', ['site', 'query_status'], 'fact_query__site_id_0a3f76_idx'),
+    ('query', ['subject', 'query_status'], 'fact_query__subject_f06b2e_idx'),
+    ('query', ['query_status', 'action_owner'], 'fact_query__query_s_4a2267_idx'),
+    ('query', ['action_owner', 'query_open_date'], 'fact_query__action__6a5201_idx'),
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0006_query_drop_label_columns'),
+    ]
+
+    operations = (
+        [
+            migrations.RemoveIndex(model_name=model_name, name=name)
+            for model_name, _fields, name in INDEXES
+        ]
+        + [
+            migrations.AddField(
+                model_name=model_name,
+                name=f'{field}_code',
+                field=code_field(field, required=False),
+            )
+            for model_name, field in CODES
+        ]
+        + [
+            # Relax the text columns so the reverse migration can re-add them empty
+            migrations.AlterField(
+                model_name=model_name,
+                name=field,
+                field=models.CharField(max_length=LEGACY_MAX_LENGTH[field], null=True, help_text=HELP[field]),
+            )
+            for model_name, field in CODES
+        ]
+        + [migrations.RunPython(labels_to_codes, codes_to_labels)]
+        + [
+            operation
+            for model_name, field in CODES
+            for operation in (
+                migrations.RemoveField(model_name=model_name, name=field),
+                migrations.RenameField(model_name=model_name, old_name=f'{field}_code', new_name=field),
+                migrations.AlterField(
+                    model_name=model_name,
+                    name=field,
+                    field=code_field(field, required=True),
+                ),
+            )
+        ]
+        + [
+            migrations.AddIndex(model_name=model_name, index=models.Index(fields=fields, name=name))
+            for model_name, fields, name in INDEXES
+        ]
+    )
@@ -0,0 +1,29 @@
+# Generated by Django 5.0 on 2026-10-16 04:34
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0007_integer_status_choices'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='crfevent',
+            options={'verbose_name': 'CRF Event', 'verbose_name_plural': 'CRF Events'},
+        ),
+        migrations.AlterModelOptions(
+            name='missingpage',
+            options={'verbose_name': 'Missing Page', 'verbose_name_plural': 'Missing Pages'},
+        ),
+        migrations.AlterModelOptions(
+            name='missingvisit',
+            options={'verbose_name': 'Missing Visit', 'verbose_name_plural': 'Missing Visits'},
+        ),
+        migrations.AlterModelOptions(
+            name='query',
+            options={'permissions': [('view_assigned_queries', 'Can view queries for assigned sites only')], 'verbose_name': 'Query', 'verbose_name_plural': 'Queries'},
+        ),
+    ]
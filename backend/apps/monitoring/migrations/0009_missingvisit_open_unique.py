@@ -0,0 +1,22 @@
+# Generated by Django 5.0 on 2026-10-16 04:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_stringdict'),
+        ('monitoring', '0008_drop_fact_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='missingvisit',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='missingvisit',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_resolved', False)), fields=('subject', 'visit_name'), name='uq_open_missing_visit'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# LZ4 TOAST compression for the long free-text / GenAI columns.
+#
+# LZ4 compresses and decompresses several times faster than the default
+# pglz, which cuts TOAST I/O when these columns are read. It needs
+# PostgreSQL 14+ built with lz4 support; on other servers and on other
+# backends (SQLite in development) this migration is a no-op. Only newly
+# written values are compressed with LZ4; existing values keep pglz until
+# they are rewritten.
+
+from django.db import migrations
+
+LONG_TEXT_COLUMNS = [
+    ('fact_query_event', 'suggested_response'),
+    ('fact_protocol_deviation', 'description'),
+    ('fact_protocol_deviation', 'ai_severity_assessment'),
+    ('fact_nonconformant_event', 'description'),
+]
+
+
+def _lz4_available(schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return False
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_settings "
+            "WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)"
+        )
+        return cursor.fetchone() is not None
+
+
+def _set_compression(method):
+    def apply(apps, schema_editor):
+        if not _lz4_available(schema_editor):
+            return
+        for table, column in LONG_TEXT_COLUMNS:
+            schema_editor.execute(
+                f'ALTER TABLE "{table}" ALTER COLUMN "{column}" SET COMPRESSION {method}'
+            )
+    return apply
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0009_missingvisit_open_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(_set_compression('lz4'), _set_compression('pglz')),
+    ]
@@ -0,0 +1,163 @@
+# Keep FACT_OPEN_ISSUE_SUMMARY current with database triggers.
+#
+# Each source fact table gets an AFTER INSERT/UPDATE/DELETE row trigger
+# that works out whether the old and new rows count as "open" and, only
+# when that changes, calls fn_bump_open_issue() to add or subtract one
+# from the matching counter (and total_open_issue_count) with a single
+# INSERT ... ON CONFLICT (study_id, subject_id) DO UPDATE. No Python
+# runs per fact change.
+#
+# The summary is rebuilt from the current facts once when the triggers
+# are installed. PostgreSQL only; on other backends (SQLite in
+# development) this migration is a no-op.
+
+from django.db import migrations
+
+COUNT_COLUMNS = [
+    'open_query_count',
+    'missing_page_count',
+    'missing_visit_count',
+    'sae_discrepancy_count',
+    'protocol_deviation_count',
+]
+
+# (table, summary column, SQL predicate for an open row in alias "f")
+SOURCES = [
+    ('fact_query_event', 'open_query_count', 'f.query_status = 1'),
+    ('fact_missing_page', 'missing_page_count', 'f.is_resolved = false'),
+    ('fact_missing_visit', 'missing_visit_count', 'f.is_resolved = false'),
+    ('fact_sae_discrepancy', 'sae_discrepancy_count', "f.resolution_status IN ('Open', 'Pending')"),
+    ('fact_protocol_deviation', 'protocol_deviation_count', "f.status IN ('Open', 'Under Review')"),
+]
+
+BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION fn_bump_open_issue(_subject varchar, _col text, _delta integer)
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    IF _delta < 0 THEN
+        -- Decrements never create a row (the subject may be mid-delete)
+        EXECUTE format(
+            'UPDATE fact_open_issue_summary
+                SET %1$I = %1$I + $2,
+                    total_open_issue_count = total_open_issue_count + $2,
+                    updated_at = now()
+              WHERE subject_id = $1', _col)
+        USING _subject, _delta;
+    ELSE
+        EXECUTE format(
+            'INSERT INTO fact_open_issue_summary
+                    (study_id, subject_id, site_id, open_query_count, missing_page_count,
+                     missing_visit_count, sae_discrepancy_count, protocol_deviation_count,
+                     total_open_issue_count, created_at, updated_at)
+             SELECT s.study_id, s.subject_id, s.site_id,
+                    CASE WHEN $3 = ''open_query_count'' THEN $2 ELSE 0 END,
+                    CASE WHEN $3 = ''missing_page_count'' THEN $2 ELSE 0 END,
+                    CASE WHEN $3 = ''missing_visit_count'' THEN $2 ELSE 0 END,
+                    CASE WHEN $3 = ''sae_discrepancy_count'' THEN $2 ELSE 0 END,
+                    CASE WHEN $3 = ''protocol_deviation_count'' THEN $2 ELSE 0 END,
+                    $2, now(), now()
+               FROM dim_subject s WHERE s.subject_id = $1
+             ON CONFLICT (study_id, subject_id) DO UPDATE
+                SET %1$I = fact_open_issue_summary.%1$I + $2,
+                    total_open_issue_count = fact_open_issue_summary.total_open_issue_count + $2,
+                    updated_at = now()', _col)
+        USING _subject, _delta, _col;
+    END IF;
+END;
+$$;
+"""
+
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION fn_open_issue_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    _col text := TG_ARGV[0];
+    _old_open boolean := false;
+    _new_open boolean := false;
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        EXECUTE format('SELECT %s FROM (SELECT ($1).*) f', TG_ARGV[1]) INTO _old_open USING OLD;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        EXECUTE format('SELECT %s FROM (SELECT ($1).*) f', TG_ARGV[1]) INTO _new_open USING NEW;
+    END IF;
+
+    IF TG_OP = 'UPDATE' AND OLD.subject_id = NEW.subject_id
+            AND coalesce(_old_open, false) = coalesce(_new_open, false) THEN
+        RETURN NULL;
+    END IF;
+    IF coalesce(_old_open, false) THEN
+        PERFORM fn_bump_open_issue(OLD.subject_id, _col, -1);
+    END IF;
+    IF coalesce(_new_open, false) THEN
+        PERFORM fn_bump_open_issue(NEW.subject_id, _col, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def _trigger_name(table):
+    return f'trg_{table}_open_issue'
+
+
+def install_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    # params=None: the function bodies contain literal % format specifiers
+    schema_editor.execute(BUMP_FUNCTION, params=None)
+    schema_editor.execute(TRIGGER_FUNCTION, params=None)
+    for table, column, predicate in SOURCES:
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS "{_trigger_name(table)}" ON "{table}"')
+        schema_editor.execute(
+            f'CREATE TRIGGER "{_trigger_name(table)}" '
+            f'AFTER INSERT OR UPDATE OR DELETE ON "{table}" '
+            f'FOR EACH ROW EXECUTE FUNCTION fn_open_issue_trigger(%s, %s)',
+            [column, predicate],
+        )
+    rebuild_summary(schema_editor)
+
+
+def rebuild_summary(schema_editor):
+    """Recompute every subject's counters from the current fact rows."""
+    counts = ',\n'.join(
+        f'(SELECT count(*) FROM "{table}" f WHERE f.subject_id = s.subject_id AND {predicate})'
+        for table, _column, predicate in SOURCES
+    )
+    columns = ', '.join(COUNT_COLUMNS)
+    total = ' + '.join(f'c.{column}' for column in COUNT_COLUMNS)
+    updates = ', '.join(f'{column} = EXCLUDED.{column}' for column in COUNT_COLUMNS)
+    schema_editor.execute(f"""
+        INSERT INTO fact_open_issue_summary
+               (study_id, subject_id, site_id, {columns}, total_open_issue_count, created_at, updated_at)
+        SELECT c.study_id, c.subject_id, c.site_id, {columns}, {total}, now(), now()
+          FROM (SELECT s.study_id, s.subject_id, s.site_id,
+                       {counts}
+                  FROM dim_subject s) AS c ({', '.join(['study_id', 'subject_id', 'site_id'] + COUNT_COLUMNS)})
+        ON CONFLICT (study_id, subject_id) DO UPDATE
+           SET {updates},
+               total_open_issue_count = EXCLUDED.total_open_issue_count,
+               updated_at = now()
+    """)
+
+
+def drop_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, _column, _predicate in SOURCES:
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS "{_trigger_name(table)}" ON "{table}"')
+    schema_editor.execute('DROP FUNCTION IF EXISTS fn_open_issue_trigger()')
+    schema_editor.execute('DROP FUNCTION IF EXISTS fn_bump_open_issue(varchar, text, integer)')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0010_lz4_long_text_columns'),
+        ('safety', '0002_labissue_site_labissue_study_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_triggers, drop_triggers),
+    ]
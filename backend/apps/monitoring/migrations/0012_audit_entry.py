@@ -0,0 +1,145 @@
+# Move the per-row audit columns of the monitoring facts into the narrow
+# FACT_AUDIT_ENTRY tail table. Existing values are copied (actor names
+# interned in DIM_STRING_DICT) before the fact columns are dropped; the
+# copy runs in reverse when the migration is unapplied.
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+USER_KIND = 3
+
+# model -> {fact column: AuditEntry field}
+AUDIT_COLUMNS = {
+    'query': {
+        'created_by': 'created_by', 'updated_by': 'updated_by',
+        'resolved_by': 'resolved_by', 'resolved_at': 'resolved_at',
+    },
+    'crfevent': {'performed_by': 'created_by'},
+    'protocoldeviation': {'reported_by': 'created_by', 'resolved_by': 'resolved_by'},
+    'nonconformantevent': {'resolved_by': 'resolved_by'},
+}
+
+
+def copy_to_audit_entries(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    StringDict = apps.get_model('core', 'StringDict')
+    AuditEntry = apps.get_model('monitoring', 'AuditEntry')
+
+    for model_name, columns in AUDIT_COLUMNS.items():
+        model = apps.get_model('monitoring', model_name)
+        has_audit = models.Q()
+        for column in columns:
+            has_audit |= models.Q(**{f'{column}__isnull': False})
+        rows = model.objects.filter(has_audit).values_list('pk', *columns)
+        if not rows.exists():
+            continue
+
+        content_type, _ = ContentType.objects.get_or_create(app_label='monitoring', model=model_name)
+        names = {
+            value for row in rows for column, value in zip(columns, row[1:])
+            if value and columns[column] != 'resolved_at'
+        }
+        StringDict.objects.bulk_create(
+            [StringDict(kind=USER_KIND, value=name) for name in names],
+            batch_size=500,
+            ignore_conflicts=True
+        )
+        user_ids = dict(StringDict.objects.filter(kind=USER_KIND).values_list('value', 'id'))
+
+        entries = []
+        for pk, *values in rows.iterator():
+            entry = AuditEntry(content_type=content_type, object_id=pk)
+            for (column, field), value in zip(columns.items(), values):
+                if field == 'resolved_at':
+                    entry.resolved_at = value
+                else:
+                    setattr(entry, f'{field}_id', user_ids.get(value))
+            entries.append(entry)
+        AuditEntry.objects.bulk_create(entries, batch_size=1000)
+
+
+def copy_from_audit_entries(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    AuditEntry = apps.get_model('monitoring', 'AuditEntry')
+
+    for model_name, columns in AUDIT_COLUMNS.items():
+        model = apps.get_model('monitoring', model_name)
+        content_type = ContentType.objects.filter(app_label='monitoring', model=model_name).first()
+        if content_type is None:
+            continue
+        entries = AuditEntry.objects.filter(content_type=content_type).select_related(
+            'created_by', 'updated_by', 'resolved_by'
+        )
+        for entry in entries.iterator():
+            values = {}
+            for column, field in columns.items():
+                value = getattr(entry, field)
+                values[column] = value if field == 'resolved_at' else getattr(value, 'value', None)
+            model.objects.filter(pk=entry.object_id).update(**values)
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('core', '0003_stringdict_user_kind'),
+        ('monitoring', '0011_open_issue_summary_triggers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('object_id', models.BigIntegerField(help_text='Primary key of the audited row')),
+                ('resolved_at', models.DateTimeField(blank=True, null=True)),
+                ('content_type', models.ForeignKey(help_text='Fact table of the audited row', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+                ('created_by', models.ForeignKey(blank=True, help_text='User or service that created/performed/reported the fact', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.stringdict')),
+                ('resolved_by', models.ForeignKey(blank=True, help_text='User or service that resolved the fact', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.stringdict')),
+                ('updated_by', models.ForeignKey(blank=True, help_text='User or service that last updated the fact', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.stringdict')),
+            ],
+            options={
+                'verbose_name': 'Audit Entry',
+                'verbose_name_plural': 'Audit Entries',
+                'db_table': 'fact_audit_entry',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='auditentry',
+            constraint=models.UniqueConstraint(fields=('content_type', 'object_id'), name='uq_audit_entry_fact'),
+        ),
+        migrations.RunPython(copy_to_audit_entries, copy_from_audit_entries),
+        migrations.RemoveField(
+            model_name='crfevent',
+            name='performed_by',
+        ),
+        migrations.RemoveField(
+            model_name='nonconformantevent',
+            name='resolved_by',
+        ),
+        migrations.RemoveField(
+            model_name='protocoldeviation',
+            name='reported_by',
+        ),
+        migrations.RemoveField(
+            model_name='protocoldeviation',
+            name='resolved_by',
+        ),
+        migrations.RemoveField(
+            model_name='query',
+            name='created_by',
+        ),
+        migrations.RemoveField(
+            model_name='query',
+            name='resolved_at',
+        ),
+        migrations.RemoveField(
+            model_name='query',
+            name='resolved_by',
+        ),
+        migrations.RemoveField(
+            model_name='query',
+            name='updated_by',
+        ),
+    ]
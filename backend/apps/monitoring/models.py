@@ -17,16 +17,210 @@ Models:
 - FACT_MISSING_PAGE
 - FACT_OPEN_ISSUE_SUMMARY
 - FACT_CRF_EVENT
+- FACT_AUDIT_ENTRY
 
 Reference: NEST2 Project Document Section 7.3, Backend Architecture
 Source: CPID_EDC_Metrics, Visit Projection Tracker, Missing Pages Report
 """
 
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
-from django.utils import timezone
-from apps.core.models import Study, Site, Subject, Visit, FormPage, Country
-import hashlib
-import json
+from django.utils.functional import cached_property
+from apps.core.models import Study, Site, Subject, Visit, FormPage, StringDict
+
+
+class LabelChoices(models.IntegerChoices):
+    """
+    IntegerChoices stored as SMALLINT that can be parsed back from EDC labels.
+
+    Loaders receive statuses as free text ('Open', 'DM', 'freeze'); parse()
+    matches a member by name or label, case-insensitively.
+    """
+
+    @classmethod
+    def parse(cls, value, default=None):
+        text = str(value or '').strip().lower()
+        for member in cls:
+            if text in (member.name.lower(), member.label.lower()):
+                return member
+        return default
+
+
+class AuditEntry(models.Model):
+    """
+    FACT_AUDIT_ENTRY - Who created/updated/resolved a monitoring fact row.
+
+    Architecture Integration:
+    - Narrow tail table for the audit columns of the high-volume fact
+      tables (Query, CRFEvent, ProtocolDeviation, NonConformantEvent);
+      dashboard scans never read these, so they stay off the fact heap
+    - One row per fact row, keyed by (content_type, object_id)
+    - Not cascaded from the facts (a GenericRelation would stop Django
+      from fast-deleting the fact tables); delete paths call delete_for()
+      and list views load entries with attach()
+    - Actor names are interned in DIM_STRING_DICT (kind=User)
+    - Fact created_at/updated_at stay on the fact tables (used for sorting
+      and retention)
+
+    Field mapping from the former fact columns:
+    - Query.created_by/updated_by/resolved_by/resolved_at → same names
+    - CRFEvent.performed_by → created_by
+    - ProtocolDeviation.reported_by → created_by, resolved_by → resolved_by
+    - NonConformantEvent.resolved_by → resolved_by
+    """
+
+    # Rows per INSERT ... ON CONFLICT statement in record_loaded()
+    RECORD_BATCH_SIZE = 500
+
+    id = models.BigAutoField(primary_key=True)
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name='+',
+        help_text="Fact table of the audited row"
+    )
+    object_id = models.BigIntegerField(help_text="Primary key of the audited row")
+    fact = GenericForeignKey('content_type', 'object_id')
+
+    created_by = models.ForeignKey(
+        StringDict, on_delete=models.PROTECT, null=True, blank=True, related_name='+',
+        help_text="User or service that created/performed/reported the fact"
+    )
+    updated_by = models.ForeignKey(
+        StringDict, on_delete=models.PROTECT, null=True, blank=True, related_name='+',
+        help_text="User or service that last updated the fact"
+    )
+    resolved_by = models.ForeignKey(
+        StringDict, on_delete=models.PROTECT, null=True, blank=True, related_name='+',
+        help_text="User or service that resolved the fact"
+    )
+    resolved_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'fact_audit_entry'
+        verbose_name = 'Audit Entry'
+        verbose_name_plural = 'Audit Entries'
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'object_id'], name='uq_audit_entry_fact'),
+        ]
+
+    def __str__(self):
+        return f"Audit {self.content_type_id}:{self.object_id}"
+
+    @classmethod
+    def record(cls, fact, resolved_at=None, **actors):
+        """
+        Create or update the audit entry of a fact row.
+
+        Usage:
+            AuditEntry.record(query, resolved_by='cra.smith', resolved_at=timezone.now())
+        """
+        ids = StringDict.intern(StringDict.Kind.USER, actors.values())
+        defaults = {f'{role}_id': ids.get(name) for role, name in actors.items()}
+        if resolved_at is not None:
+            defaults['resolved_at'] = resolved_at
+        entry, _ = cls.objects.update_or_create(
+            content_type=ContentType.objects.get_for_model(fact),
+            object_id=fact.pk,
+            defaults=defaults
+        )
+        # Keep a cached AuditedFact.audit in step with the stored entry
+        fact.__dict__['audit'] = entry
+        return entry
+
+    @classmethod
+    def record_loaded(cls, model, actor, created_ids=(), updated_ids=()):
+        """
+        Record one actor against a batch of fact rows a loader wrote.
+
+        Rows in created_ids get created_by, rows in updated_ids get
+        updated_by. The actor is interned once and all entries are written
+        with one upsert per RECORD_BATCH_SIZE rows (ON CONFLICT on
+        (content_type, object_id) only overwrites updated_by), instead of
+        the per-row queries of record().
+
+        Usage:
+            AuditEntry.record_loaded(Query, 'load_study', created_ids, updated_ids)
+        """
+        if not created_ids and not updated_ids:
+            return
+        actor_id = StringDict.intern(StringDict.Kind.USER, [actor])[actor]
+        content_type = ContentType.objects.get_for_model(model)
+        entries = [
+            cls(content_type=content_type, object_id=pk, created_by_id=actor_id) for pk in created_ids
+        ] + [
+            cls(content_type=content_type, object_id=pk, updated_by_id=actor_id) for pk in updated_ids
+        ]
+        cls.objects.bulk_create(
+            entries,
+            batch_size=cls.RECORD_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['content_type', 'object_id'],
+            update_fields=['updated_by']
+        )
+
+    @classmethod
+    def attach(cls, facts):
+        """
+        Load the audit entries of a list of fact rows in one query.
+
+        Fills each row's AuditedFact.audit, so a list view reading .audit
+        does not run one query per row (the AuditedFact counterpart of
+        prefetch_related_objects). All rows must be of the same model.
+
+        Usage:
+            queries = list(Query.objects.filter(subject=subject))
+            AuditEntry.attach(queries)
+        """
+        if not facts:
+            return
+        entries = {
+            entry.object_id: entry
+            for entry in cls.objects.filter(
+                content_type=ContentType.objects.get_for_model(facts[0]),
+                object_id__in=[fact.pk for fact in facts]
+            ).select_related('created_by', 'updated_by', 'resolved_by')
+        }
+        for fact in facts:
+            fact.__dict__['audit'] = entries.get(fact.pk)
+
+    @classmethod
+    def delete_for(cls, model, object_ids):
+        """
+        Delete the audit entries of a fact model's rows.
+
+        object_ids may be a list of primary keys or a values('pk')
+        queryset; call this before deleting the facts themselves.
+
+        Usage:
+            AuditEntry.delete_for(Query, stale_queries.values('pk'))
+        """
+        return cls.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            object_id__in=object_ids
+        ).delete()
+
+
+class AuditedFact(models.Model):
+    """Abstract base for fact models whose audit columns live in AuditEntry."""
+
+    class Meta:
+        abstract = True
+
+    @cached_property
+    def audit(self):
+        """
+        The row's AuditEntry, or None.
+
+        The first access on an instance runs one query; the result is
+        cached on the instance. Load lists with AuditEntry.attach()
+        instead of reading .audit row by row.
+        """
+        return AuditEntry.objects.filter(
+            content_type=ContentType.objects.get_for_model(self),
+            object_id=self.pk
+        ).first()
 
 
 class OpenIssueSummary(models.Model):
@@ -35,7 +229,10 @@ class OpenIssueSummary(models.Model):
 
     Architecture Integration:
     - Pre-computed counts for dashboard performance
-    - Updated incrementally when issues change
+    - Updated incrementally when issues change: on PostgreSQL, row triggers
+      on the query, missing page/visit, SAE and deviation tables bump the
+      counters in the database (migration 0011), so the ORM never writes
+      these rows on the hot path
     - Part of KPI + Analytics Service cache layer
     """
 
@@ -80,7 +277,7 @@ class OpenIssueSummary(models.Model):
         ]
 
 
-class CRFEvent(models.Model):
+class CRFEvent(AuditedFact):
     """
     FACT_CRF_EVENT - CRF freeze/unfreeze/lock/unlock events.
 
@@ -90,14 +287,13 @@ class CRFEvent(models.Model):
     - Feeds database lock status tracking
     """
 
-    EVENT_TYPE_CHOICES = [
-        ('freeze', 'Freeze'),
-        ('unfreeze', 'Unfreeze'),
-        ('lock', 'Lock'),
-        ('unlock', 'Unlock'),
-        ('sign', 'Sign'),
-        ('unsign', 'Unsign'),
-    ]
+    class EventType(LabelChoices):
+        FREEZE = 1, 'Freeze'
+        UNFREEZE = 2, 'Unfreeze'
+        LOCK = 3, 'Lock'
+        UNLOCK = 4, 'Unlock'
+        SIGN = 5, 'Sign'
+        UNSIGN = 6, 'Unsign'
 
     crf_event_id = models.AutoField(primary_key=True)
     study = models.ForeignKey(
@@ -121,9 +317,8 @@ class CRFEvent(models.Model):
     )
 
     # Event details
-    event_type = models.CharField(
-        max_length=20,
-        choices=EVENT_TYPE_CHOICES,
+    event_type = models.SmallIntegerField(
+        choices=EventType.choices,
         help_text="Type of CRF event"
     )
     event_time = models.DateTimeField(
@@ -136,8 +331,7 @@ class CRFEvent(models.Model):
     # Blockchain proof
     blockchain_tx_hash = models.CharField(max_length=66, null=True, blank=True)
 
-    # Audit
-    performed_by = models.CharField(max_length=100, null=True, blank=True)
+    # Audit (performed_by lives in AuditEntry.created_by)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -145,14 +339,15 @@ class CRFEvent(models.Model):
         db_table = 'fact_crf_event'
         verbose_name = 'CRF Event'
         verbose_name_plural = 'CRF Events'
-        ordering = ['-event_time']
+        # No default ordering: aggregates skip the sort; list callers order_by() explicitly
+        # event_time range scans use a BRIN index (migration 0003, PostgreSQL)
         indexes = [
             models.Index(fields=['study', 'event_type']),
             models.Index(fields=['subject', 'event_time']),
         ]
 
 
-class Query(models.Model):
+class Query(AuditedFact):
     """
     FACT_QUERY_EVENT - Data queries raised during monitoring.
 
@@ -181,19 +376,17 @@ class Query(models.Model):
     Source: CPID_EDC_Metrics 'Query Report - Cumulative' sheet
     """
 
-    QUERY_STATUS_CHOICES = [
-        ('Open', 'Open'),
-        ('Answered', 'Answered'),
-        ('Closed', 'Closed'),
-        ('Cancelled', 'Cancelled'),
-    ]
+    class QueryStatus(LabelChoices):
+        OPEN = 1, 'Open'
+        ANSWERED = 2, 'Answered'
+        CLOSED = 3, 'Closed'
+        CANCELLED = 4, 'Cancelled'
 
-    ACTION_OWNER_CHOICES = [
-        ('Site', 'Site'),
-        ('CRA', 'CRA'),
-        ('DM', 'Data Management'),
-        ('Sponsor', 'Sponsor'),
-    ]
+    class ActionOwner(LabelChoices):
+        SITE = 1, 'Site'
+        CRA = 2, 'CRA'
+        DM = 3, 'Data Management'
+        SPONSOR = 4, 'Sponsor'
 
     # Primary key
     query_id = models.AutoField(primary_key=True)
@@ -264,16 +457,22 @@ class Query(models.Model):
         help_text="Site number (denormalized from site)"
     )
 
-    # Query identification
-    folder_name = models.CharField(
-        max_length=200,
+    # Query identification (labels interned in DIM_STRING_DICT)
+    folder = models.ForeignKey(
+        StringDict,
+        on_delete=models.PROTECT,
         null=True,
         blank=True,
+        related_name='+',
+        limit_choices_to={'kind': StringDict.Kind.FOLDER},
         help_text="EDC folder name"
     )
 
-    form_name = models.CharField(
-        max_length=200,
+    form = models.ForeignKey(
+        StringDict,
+        on_delete=models.PROTECT,
+        related_name='+',
+        limit_choices_to={'kind': StringDict.Kind.FORM},
         help_text="EDC form name where query exists"
     )
 
@@ -292,15 +491,13 @@ class Query(models.Model):
     )
 
     # Query attributes
-    query_status = models.CharField(
-        max_length=50,
-        choices=QUERY_STATUS_CHOICES,
+    query_status = models.SmallIntegerField(
+        choices=QueryStatus.choices,
         help_text="Current query status"
     )
 
-    action_owner = models.CharField(
-        max_length=100,
-        choices=ACTION_OWNER_CHOICES,
+    action_owner = models.SmallIntegerField(
+        choices=ActionOwner.choices,
         help_text="Who is responsible for resolving this query"
     )
 
@@ -367,19 +564,16 @@ class Query(models.Model):
         help_text="Blockchain transaction hash for query resolution event"
     )
 
-    # Audit fields
+    # Audit fields (created_by/updated_by/resolved_by/resolved_at live in AuditEntry)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    created_by = models.CharField(max_length=100, null=True, blank=True)
-    updated_by = models.CharField(max_length=100, null=True, blank=True)
-    resolved_by = models.CharField(max_length=100, null=True, blank=True)
-    resolved_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = 'fact_query_event'
         verbose_name = 'Query'
         verbose_name_plural = 'Queries'
-        ordering = ['-query_open_date']
+        # No default ordering: aggregates skip the sort; list callers order_by() explicitly
+        # query_open_date range scans use a BRIN index (migration 0003, PostgreSQL)
         indexes = [
             models.Index(fields=['study', 'query_status']),
             models.Index(fields=['site', 'query_status']),
@@ -393,7 +587,17 @@ class Query(models.Model):
 
 
     def __str__(self):
-        return f"Query {self.log_number} - {self.subject.subject_id}"
+        return f"Query {self.log_number} - {self.subject_id}"
+
+    @property
+    def folder_name(self):
+        """EDC folder label (select_related('folder') to avoid a lookup per row)."""
+        return self.folder.value if self.folder_id else None
+
+    @property
+    def form_name(self):
+        """EDC form label (select_related('form') to avoid a lookup per row)."""
+        return self.form.value if self.form_id else None
 
 
 class SDVStatus(models.Model):
@@ -544,7 +748,7 @@ class PISignatureStatus(models.Model):
         verbose_name_plural = 'PI Signature Statuses'
 
 
-class ProtocolDeviation(models.Model):
+class ProtocolDeviation(AuditedFact):
     """
     FACT_PROTOCOL_DEVIATION - Protocol deviations and violations.
 
@@ -618,11 +822,9 @@ class ProtocolDeviation(models.Model):
         help_text="AI-generated severity assessment and recommendations"
     )
 
-    # Audit fields
+    # Audit fields (reported_by/resolved_by live in AuditEntry)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    reported_by = models.CharField(max_length=100, null=True, blank=True)
-    resolved_by = models.CharField(max_length=100, null=True, blank=True)
 
     class Meta:
         db_table = 'fact_protocol_deviation'
@@ -630,7 +832,7 @@ class ProtocolDeviation(models.Model):
         verbose_name_plural = 'Protocol Deviations'
 
 
-class NonConformantEvent(models.Model):
+class NonConformantEvent(AuditedFact):
     """
     FACT_NONCONFORMANT_EVENT - Non-conformant data events.
 
@@ -695,15 +897,15 @@ class NonConformantEvent(models.Model):
         help_text="Date issue was resolved"
     )
 
-    # Audit fields
+    # Audit fields (resolved_by lives in AuditEntry)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    resolved_by = models.CharField(max_length=100, null=True, blank=True)
 
     class Meta:
         db_table = 'fact_nonconformant_event'
         verbose_name = 'Non-Conformant Event'
         verbose_name_plural = 'Non-Conformant Events'
+        # detected_date range scans use a BRIN index (migration 0003, PostgreSQL)
 
 
 class MissingVisit(models.Model):
@@ -720,6 +922,8 @@ class MissingVisit(models.Model):
     - Represents visits that are past projected date but not completed
     - Days_outstanding tracks urgency for follow-up
     - Feeds "missing visits" blocker in Clean Patient Status
+    - At most one unresolved row per (subject, visit_name); resolved rows
+      are kept as history and the visit can go missing again
 
     Source: Visit Projection Tracker
     """
@@ -778,12 +982,19 @@ class MissingVisit(models.Model):
         db_table = 'fact_missing_visit'
         verbose_name = 'Missing Visit'
         verbose_name_plural = 'Missing Visits'
-        unique_together = [['subject', 'visit_name']]
-        ordering = ['-days_outstanding']
+        # No default ordering: aggregates skip the sort; list callers order_by() explicitly
         indexes = [
             models.Index(fields=['subject', 'days_outstanding']),
             models.Index(fields=['site', 'is_resolved']),
         ]
+        constraints = [
+            # Only one OPEN missing visit per subject/visit; resolved rows may repeat
+            models.UniqueConstraint(
+                fields=['subject', 'visit_name'],
+                condition=models.Q(is_resolved=False),
+                name='uq_open_missing_visit'
+            ),
+        ]
 
 
 class MissingPage(models.Model):
@@ -878,7 +1089,8 @@ class MissingPage(models.Model):
         db_table = 'fact_missing_page'
         verbose_name = 'Missing Page'
         verbose_name_plural = 'Missing Pages'
-        ordering = ['-days_missing']
+        # No default ordering: aggregates skip the sort; list callers order_by() explicitly
+        # visit_date range scans use a BRIN index (migration 0003, PostgreSQL)
         indexes = [
             models.Index(fields=['subject', 'days_missing']),
             models.Index(fields=['site', 'is_resolved']),
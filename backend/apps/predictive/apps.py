@@ -8,3 +8,7 @@ class PredictiveConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.predictive'
     verbose_name = 'Predictive AI Platform'
+
+    def ready(self):
+        """Connect signal handlers."""
+        from . import signals  # noqa: F401
@@ -0,0 +1,14 @@
+"""
+Cache keys for the Predictive AI Platform.
+
+Kept free of model and ML imports so signal handlers can use them
+without loading sklearn/pandas during app startup.
+"""
+
+# Longest enrollment forecast horizon accepted, in months
+FORECAST_MAX_MONTHS = 24
+
+
+def enrollment_forecast_cache_key(study_id, months_ahead):
+    """Cache key for an enrollment forecast response."""
+    return f'enrollment_forecast:{study_id}:{months_ahead}'
@@ -9,10 +9,19 @@ This command trains:
 2. Query Resolution Time Prediction Model
 3. Site Performance Prediction Model
 
-Models are saved to ML_MODELS_DIR (default: backend/ml_models/)
+Models are saved to ML_MODELS_DIR (default: backend/ml_models/), each in its
+own file and together in bundle.joblib; manifest.json records when each
+model was trained, so a model retrained after bundling is not served from
+the stale bundle.
 """
 
+import os
+
 from django.core.management.base import BaseCommand
+from django.db import connections
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
+
 from apps.predictive.ml_models import PredictiveMLService
 
 
@@ -27,6 +36,21 @@ class Command(BaseCommand):
             help='Study ID to train models on (default: Study_1)'
         )
 
+    def _run_trainer(self, train, study_id):
+        """
+        Run one trainer in a worker thread.
+
+        Returns:
+            (result, error) - the trainer's result, or the exception it raised
+        """
+        try:
+            return train(study_id), None
+        except Exception as e:
+            return None, e
+        finally:
+            # Close the DB connection this worker thread opened
+            connections.close_all()
+
     def handle(self, *args, **options):
         study_id = options['study_id']
 
@@ -44,62 +68,81 @@ class Command(BaseCommand):
         # Track results
         results = {}
 
+        # The three models are independent, so train them side by side.
+        # Threads rather than processes: the ORM and DB connection stay in
+        # this process and sklearn releases the GIL while fitting.
+        self.stdout.write(self.style.WARNING(
+            '\nTraining dropout risk, query resolution time and site performance '
+            'models in parallel...'
+        ))
+        trainers = [
+            ml_service.train_dropout_risk_model,
+            ml_service.train_query_resolution_model,
+            ml_service.train_site_performance_model,
+        ]
+        # Split the cores between the concurrent fits instead of letting
+        # each model use all of them: the random forests get n_jobs, the
+        # OpenMP/BLAS pools (gradient boosting) are capped by threadpoolctl
+        ml_service.n_jobs = max(1, (os.cpu_count() or 1) // len(trainers))
+        with threadpool_limits(limits=ml_service.n_jobs):
+            (
+                (dropout_result, dropout_error),
+                (query_result, query_error),
+                (site_result, site_error),
+            ) = Parallel(n_jobs=len(trainers), backend='threading')(
+                delayed(self._run_trainer)(train, study_id) for train in trainers
+            )
+
         # ====================================================================
-        # 1. Train Dropout Risk Model
+        # 1. Report Dropout Risk Model
         # ====================================================================
-        self.stdout.write(self.style.WARNING('\n[1/3] Training Dropout Risk Prediction Model...'))
-        try:
-            dropout_result = ml_service.train_dropout_risk_model(study_id)
-            if dropout_result:
-                results['dropout_risk'] = dropout_result
-                self.stdout.write(self.style.SUCCESS(
-                    f'  [OK] Dropout Model Trained\n'
-                    f'    - Accuracy: {dropout_result["accuracy"]:.2%}\n'
-                    f'    - Training Samples: {dropout_result["samples"]}\n'
-                    f'    - Top Features: Missing Visits, Open Queries, DQI Score'
-                ))
-            else:
-                self.stdout.write(self.style.ERROR('  [X] Insufficient data for dropout model'))
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f'  [X] Error: {e}'))
+        self.stdout.write(self.style.WARNING('\n[1/3] Dropout Risk Prediction Model'))
+        if dropout_error:
+            self.stdout.write(self.style.ERROR(f'  [X] Error: {dropout_error}'))
+        elif dropout_result:
+            results['dropout_risk'] = dropout_result
+            self.stdout.write(self.style.SUCCESS(
+                f'  [OK] Dropout Model Trained\n'
+                f'    - Accuracy: {dropout_result["accuracy"]:.2%}\n'
+                f'    - Training Samples: {dropout_result["samples"]}\n'
+                f'    - Top Features: Missing Visits, Open Queries, DQI Score'
+            ))
+        else:
+            self.stdout.write(self.style.ERROR('  [X] Insufficient data for dropout model'))
 
         # ====================================================================
-        # 2. Train Query Resolution Time Model
+        # 2. Report Query Resolution Time Model
         # ====================================================================
-        self.stdout.write(self.style.WARNING('\n[2/3] Training Query Resolution Time Prediction Model...'))
-        try:
-            query_result = ml_service.train_query_resolution_model(study_id)
-            if query_result:
-                results['query_resolution'] = query_result
-                self.stdout.write(self.style.SUCCESS(
-                    f'  [OK] Query Resolution Model Trained\n'
-                    f'    - MAE: {query_result["mae"]:.2f} days\n'
-                    f'    - R² Score: {query_result["r2_score"]:.3f}\n'
-                    f'    - Training Samples: {query_result["samples"]}'
-                ))
-            else:
-                self.stdout.write(self.style.ERROR('  [X] Insufficient data for query resolution model'))
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f'  [X] Error: {e}'))
+        self.stdout.write(self.style.WARNING('\n[2/3] Query Resolution Time Prediction Model'))
+        if query_error:
+            self.stdout.write(self.style.ERROR(f'  [X] Error: {query_error}'))
+        elif query_result:
+            results['query_resolution'] = query_result
+            self.stdout.write(self.style.SUCCESS(
+                f'  [OK] Query Resolution Model Trained\n'
+                f'    - MAE: {query_result["mae"]:.2f} days\n'
+                f'    - R² Score: {query_result["r2_score"]:.3f}\n'
+                f'    - Training Samples: {query_result["samples"]}'
+            ))
+        else:
+            self.stdout.write(self.style.ERROR('  [X] Insufficient data for query resolution model'))
 
         # ====================================================================
-        # 3. Train Site Performance Model
+        # 3. Report Site Performance Model
         # ====================================================================
-        self.stdout.write(self.style.WARNING('\n[3/3] Training Site Performance Prediction Model...'))
-        try:
-            site_result = ml_service.train_site_performance_model(study_id)
-            if site_result:
-                results['site_performance'] = site_result
-                self.stdout.write(self.style.SUCCESS(
-                    f'  [OK] Site Performance Model Trained\n'
-                    f'    - MAE: {site_result["mae"]:.3f}\n'
-                    f'    - R² Score: {site_result["r2_score"]:.3f}\n'
-                    f'    - Training Samples: {site_result["samples"]}'
-                ))
-            else:
-                self.stdout.write(self.style.ERROR('  [X] Insufficient data for site performance model'))
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f'  [X] Error: {e}'))
+        self.stdout.write(self.style.WARNING('\n[3/3] Site Performance Prediction Model'))
+        if site_error:
+            self.stdout.write(self.style.ERROR(f'  [X] Error: {site_error}'))
+        elif site_result:
+            results['site_performance'] = site_result
+            self.stdout.write(self.style.SUCCESS(
+                f'  [OK] Site Performance Model Trained\n'
+                f'    - MAE: {site_result["mae"]:.3f}\n'
+                f'    - R² Score: {site_result["r2_score"]:.3f}\n'
+                f'    - Training Samples: {site_result["samples"]}'
+            ))
+        else:
+            self.stdout.write(self.style.ERROR('  [X] Insufficient data for site performance model'))
 
         # ====================================================================
         # Summary
@@ -117,6 +160,12 @@ class Command(BaseCommand):
             for model_name, result in results.items():
                 self.stdout.write(f'  [OK] {model_name}')
 
+            # Bundle the models so prediction loads them with one unpickle
+            bundled = ml_service.save_model_bundle()
+            self.stdout.write(
+                f'\nBundled {len(bundled)} model(s) into: {ml_service.bundle_path}'
+            )
+
             self.stdout.write(self.style.SUCCESS(
                 f'\nModels saved to: {ml_service.models_dir}\n'
                 f'\nNext steps:\n'
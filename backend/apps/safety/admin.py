@@ -11,6 +11,8 @@ class LabIssueAdmin(admin.ModelAdmin):
     list_display = ['lab_issue_id', 'subject', 'visit_name', 'test_name', 'issue', 'lab_date']
     list_filter = ['issue', 'study', 'site']
     search_fields = ['subject__subject_external_id', 'test_name']
+    list_select_related = ['subject']
+    raw_id_fields = ['study', 'site', 'subject']
 
 
 @admin.register(SAEDiscrepancy)
@@ -18,3 +20,5 @@ class SAEDiscrepancyAdmin(admin.ModelAdmin):
     list_display = ['sae_id', 'subject', 'discrepancy_id', 'resolution_status', 'case_status', 'discrepancy_created_timestamp']
     list_filter = ['resolution_status', 'case_status', 'study', 'site']
     search_fields = ['discrepancy_id', 'subject__subject_external_id']
+    list_select_related = ['subject']
+    raw_id_fields = ['study', 'site', 'subject']
@@ -0,0 +1,112 @@
+# Store SAEDiscrepancy.resolution_status as a SMALLINT code (IntegerChoices)
+# instead of a free-text CharField.
+#
+# Same column rebuild as monitoring 0007: add a nullable code column,
+# translate the labels, drop the text column and rename the code column
+# into place (a direct AlterField would emit "USING column::smallint" and
+# fail on the existing labels). The (site, resolution_status) index is
+# dropped first and recreated on the new column.
+#
+# On PostgreSQL the open-issue summary trigger on fact_sae_discrepancy
+# (monitoring 0011) tests resolution_status against the text labels, so it
+# is dropped for the swap and recreated with the integer codes.
+
+from django.db import migrations, models
+
+CODES = {'open': 1, 'pending': 2, 'resolved': 3, 'closed': 4}
+LEGACY_LABELS = {1: 'Open', 2: 'Pending', 3: 'Resolved', 4: 'Closed'}
+CHOICES = [(1, 'Open'), (2, 'Pending'), (3, 'Resolved'), (4, 'Closed')]
+
+TABLE = 'fact_sae_discrepancy'
+TRIGGER = f'trg_{TABLE}_open_issue'
+LABEL_PREDICATE = "f.resolution_status IN ('Open', 'Pending')"
+CODE_PREDICATE = 'f.resolution_status IN (1, 2)'
+INDEX_NAME = 'fact_sae_di_site_id_6881d4_idx'
+
+
+def _create_trigger(schema_editor, predicate):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP TRIGGER IF EXISTS "{TRIGGER}" ON "{TABLE}"')
+    schema_editor.execute(
+        f'CREATE TRIGGER "{TRIGGER}" '
+        f'AFTER INSERT OR UPDATE OR DELETE ON "{TABLE}" '
+        f'FOR EACH ROW EXECUTE FUNCTION fn_open_issue_trigger(%s, %s)',
+        ['sae_discrepancy_count', predicate],
+    )
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP TRIGGER IF EXISTS "{TRIGGER}" ON "{TABLE}"')
+
+
+def create_label_trigger(apps, schema_editor):
+    _create_trigger(schema_editor, LABEL_PREDICATE)
+
+
+def create_code_trigger(apps, schema_editor):
+    _create_trigger(schema_editor, CODE_PREDICATE)
+
+
+def labels_to_codes(apps, schema_editor):
+    model = apps.get_model('safety', 'SAEDiscrepancy')
+    labels = list(model.objects.order_by().values_list('resolution_status', flat=True).distinct())
+    # Refuse to guess: a label with no code stops the migration and is
+    # listed, so it can be corrected in the data before migrating again
+    unmapped = sorted(repr(label) for label in labels if str(label or '').strip().lower() not in CODES)
+    if unmapped:
+        raise ValueError(
+            'Unrecognised saediscrepancy.resolution_status labels, no code to migrate them to: '
+            + ', '.join(unmapped)
+        )
+    for label in labels:
+        model.objects.filter(resolution_status=label).update(resolution_status_code=CODES[label.strip().lower()])
+
+
+def codes_to_labels(apps, schema_editor):
+    model = apps.get_model('safety', 'SAEDiscrepancy')
+    for code, label in LEGACY_LABELS.items():
+        model.objects.filter(resolution_status_code=code).update(resolution_status=label)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0011_open_issue_summary_triggers'),
+        ('safety', '0002_labissue_site_labissue_study_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(model_name='saediscrepancy', name=INDEX_NAME),
+        migrations.RunPython(drop_trigger, create_label_trigger),
+        migrations.AddField(
+            model_name='saediscrepancy',
+            name='resolution_status_code',
+            field=models.SmallIntegerField(choices=CHOICES, null=True, help_text='Current resolution status'),
+        ),
+        # Relax the text column so the reverse migration can re-add it empty
+        migrations.AlterField(
+            model_name='saediscrepancy',
+            name='resolution_status',
+            field=models.CharField(max_length=50, null=True, help_text='Current resolution status'),
+        ),
+        migrations.RunPython(labels_to_codes, codes_to_labels),
+        migrations.RemoveField(model_name='saediscrepancy', name='resolution_status'),
+        migrations.RenameField(
+            model_name='saediscrepancy',
+            old_name='resolution_status_code',
+            new_name='resolution_status',
+        ),
+        migrations.AlterField(
+            model_name='saediscrepancy',
+            name='resolution_status',
+            field=models.SmallIntegerField(choices=CHOICES, default=1, help_text='Current resolution status'),
+        ),
+        migrations.RunPython(create_code_trigger, drop_trigger),
+        migrations.AddIndex(
+            model_name='saediscrepancy',
+            index=models.Index(fields=['site', 'resolution_status'], name=INDEX_NAME),
+        ),
+    ]
@@ -73,12 +73,11 @@ class SAEDiscrepancy(models.Model):
     HIGHEST SEVERITY BLOCKER - Unresolved SAE discrepancies have weight 0.25 in DQI.
     """
 
-    RESOLUTION_STATUS_CHOICES = [
-        ('Open', 'Open'),
-        ('Pending', 'Pending'),
-        ('Resolved', 'Resolved'),
-        ('Closed', 'Closed'),
-    ]
+    class ResolutionStatus(models.IntegerChoices):
+        OPEN = 1, 'Open'
+        PENDING = 2, 'Pending'
+        RESOLVED = 3, 'Resolved'
+        CLOSED = 4, 'Closed'
 
     sae_id = models.AutoField(primary_key=True)
     study = models.ForeignKey(Study, on_delete=models.CASCADE, related_name='sae_discrepancies')
@@ -89,10 +88,9 @@ class SAEDiscrepancy(models.Model):
     form_name = models.CharField(max_length=200, null=True, blank=True)
     
     # Resolution tracking (per ER diagram)
-    resolution_status = models.CharField(
-        max_length=50,
-        choices=RESOLUTION_STATUS_CHOICES,
-        default='Open',
+    resolution_status = models.SmallIntegerField(
+        choices=ResolutionStatus.choices,
+        default=ResolutionStatus.OPEN,
         help_text="Current resolution status"
     )
     
@@ -0,0 +1,64 @@
+"""
+Queue-backed file logging for Clinical Trial Control Tower.
+
+Request threads only put records on an in-memory queue; a single
+background QueueListener thread does the file writes, so a slow disk
+never holds the handler lock on the request path.
+"""
+
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_handler = None
+_listener = None
+
+
+def queue_file_handler(filename):
+    """
+    Build the QueueHandler used by ``LOGGING['handlers']['file']``.
+
+    dictConfig sets the configured formatter on the QueueHandler, which
+    formats each record before enqueueing it, so the FileHandler owned
+    by the listener thread writes the message as-is.
+    """
+    global _handler, _listener
+
+    if _listener is not None:
+        _listener.stop()
+
+    log_queue = queue.Queue(-1)
+    _handler = QueueHandler(log_queue)
+    _listener = QueueListener(log_queue, logging.FileHandler(filename))
+    _listener.start()
+    return _handler
+
+
+def _stop_listener():
+    """Flush queued records to disk on interpreter shutdown."""
+    if _listener is not None:
+        _listener.stop()
+
+
+def _restart_listener_in_child():
+    """
+    Give a forked worker its own queue and listener thread.
+
+    The listener thread does not survive fork (gunicorn --preload
+    configures logging in the master), and the inherited queue's lock
+    may have been held by that thread at fork time.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+    log_queue = queue.Queue(-1)
+    _handler.queue = log_queue
+    _listener = QueueListener(log_queue, *_listener.handlers)
+    _listener.start()
+
+
+atexit.register(_stop_listener)
+os.register_at_fork(after_in_child=_restart_listener_in_child)
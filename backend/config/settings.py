@@ -45,6 +45,8 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    # Let WhiteNoise serve static files under runserver too
+    'whitenoise.runserver_nostatic',
     'django.contrib.staticfiles',
 
     # Third-party apps
@@ -70,6 +72,9 @@ MIDDLEWARE = [
     # Security middleware
     'django.middleware.security.SecurityMiddleware',
 
+    # Static files (must be right after SecurityMiddleware)
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+
     # CORS middleware (must be before CommonMiddleware)
     'corsheaders.middleware.CorsMiddleware',
 
@@ -119,10 +124,39 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# SQLite by default; set DB_ENGINE and the DB_* connection values in .env
+# to run against PostgreSQL (see .env.example)
+DB_ENGINE = env('DB_ENGINE', default='django.db.backends.sqlite3')
+DB_NAME = env('DB_NAME', default='db.sqlite3')
+if DB_ENGINE == 'django.db.backends.sqlite3':
+    # A relative SQLite file name is resolved against backend/
+    DB_NAME = BASE_DIR / DB_NAME
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'ENGINE': DB_ENGINE,
+        'NAME': DB_NAME,
+        'USER': env('DB_USER', default=''),
+        'PASSWORD': env('DB_PASSWORD', default=''),
+        'HOST': env('DB_HOST', default=''),
+        'PORT': env('DB_PORT', default=''),
+        # Keep connections open across requests (per worker thread) instead
+        # of reconnecting each time; health checks drop dead ones first
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=600),
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Per-process memory cache; point at Redis when running several workers so
+# invalidation reaches all of them.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'clinical-trial-control-tower',
     }
 }
 
@@ -174,6 +208,19 @@ STATICFILES_DIRS = [
     BASE_DIR.parent / 'frontend',
 ]
 
+# WhiteNoise serves STATIC_ROOT from an in-memory file index, with the
+# gzip/brotli copies written by collectstatic. Files are not renamed
+# with content hashes because the templates link /static/... paths
+# directly, so they keep WhiteNoise's short default max-age.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedStaticFilesStorage',
+    },
+}
+
 # Media files (User uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -191,10 +238,10 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 100,
+    # The browsable API is a development aid; production serves JSON only
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
-    ],
+        'apps.api.renderers.ORJSONRenderer',
+    ] + (['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
     'DEFAULT_AUTHENTICATION_CLASSES': [],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
@@ -272,7 +319,9 @@ LOGGING = {
             'formatter': 'verbose',
         },
         'file': {
-            'class': 'logging.FileHandler',
+            # QueueHandler in front of a FileHandler on a listener thread,
+            # so request threads never block on the log file write.
+            '()': 'config.log_queue.queue_file_handler',
             'filename': BASE_DIR / 'logs' / 'django.log',
             'formatter': 'verbose',
         },
@@ -335,6 +384,7 @@ ANTHROPIC_API_KEY = env('ANTHROPIC_API_KEY', default='')
 
 # ML Models Configuration (Phase 6)
 ML_MODELS_DIR = BASE_DIR / 'ml_models'
+ENROLLMENT_FORECAST_CACHE_TTL = 300  # seconds
 
 # Blockchain Configuration (Phase 7)
 BLOCKCHAIN_NETWORK = env('BLOCKCHAIN_NETWORK', default='http://127.0.0.1:8545')
@@ -7,7 +7,7 @@ This module defines all URL routes for the application including:
 - Frontend template rendering routes
 - Health check endpoint for monitoring
 - Authentication (login, logout)
-- Static/Media file serving in development mode
+- Media file serving in development mode
 
 Reference: Django URL dispatcher docs
 https://docs.djangoproject.com/en/5.0/topics/http/urls/
@@ -18,30 +18,11 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.views.generic import TemplateView
-from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
 
-# Import auth views
+# Import auth and health check views
 from apps.core.auth_views import login_view, logout_view, user_me_api
-
-
-def health_check(request):
-    """
-    Health check endpoint for monitoring and load balancers.
-    
-    Purpose: Returns a simple JSON response indicating the server is running.
-    Inputs: HTTP GET request (no parameters required)
-    Outputs: JSON object with status='ok' and HTTP 200
-    Side effects: None (read-only operation)
-    
-    Usage: GET /health/
-    """
-    return JsonResponse({
-        'status': 'ok',
-        'service': 'Clinical Trial Control Tower',
-        'version': '1.0.0'
-    })
-
+from apps.core.views import health_check
 
 # Admin site customization - branding for Django admin interface
 admin.site.site_header = "Clinical Trial Control Tower"
@@ -72,20 +53,22 @@ urlpatterns = [
 
     # =========================================
     # REST API Endpoints (versioned)
-    # All API routes are prefixed with /api/v1/
+    # All API routes live under a single /api/v1/ include, so requests
+    # for any other prefix skip the whole API subtree in one match.
     # =========================================
-    
-    # Core data API - studies, sites, subjects, metrics
-    path('api/v1/', include('apps.api.urls')),
-    
-    # GenAI service API - AI-powered suggestions and analysis
-    path('api/v1/genai/', include('apps.genai.urls')),
-    
-    # Predictive ML API - risk predictions and forecasting
-    path('api/v1/predictions/', include('apps.predictive.urls')),
-    
-    # Blockchain API - audit trails and integrity verification
-    path('api/v1/blockchain/', include('apps.blockchain.urls')),
+    path('api/v1/', include([
+        # Core data API - studies, sites, subjects, metrics
+        path('', include('apps.api.urls')),
+
+        # GenAI service API - AI-powered suggestions and analysis
+        path('genai/', include('apps.genai.urls')),
+
+        # Predictive ML API - risk predictions and forecasting
+        path('predictions/', include('apps.predictive.urls')),
+
+        # Blockchain API - audit trails and integrity verification
+        path('blockchain/', include('apps.blockchain.urls')),
+    ])),
 
     # =========================================
     # Frontend Template Routes (Protected)
@@ -167,14 +150,9 @@ urlpatterns = [
 
 
 # =========================================
-# Static and Media File Serving (Development Only)
-# In production, these are served by nginx/Apache
+# Media File Serving (Development Only)
+# Static files are served by WhiteNoise in every environment; uploaded
+# media is served by nginx/Apache in production.
 # =========================================
 if settings.DEBUG:
-    # Serve uploaded media files during development
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-    
-    # Serve static files (CSS, JS, images) during development
-    # Note: In production, run `collectstatic` and serve via web server
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-
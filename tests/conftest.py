@@ -0,0 +1,30 @@
+"""Shared fixtures: a minimal study with one site and one subject."""
+
+import pytest
+
+from apps.core.models import Country, Site, Study, Subject
+
+
+@pytest.fixture
+def study(db):
+    return Study.objects.create(study_id='Study_T', study_name='Test Study')
+
+
+@pytest.fixture
+def site(study):
+    country = Country.objects.create(
+        study=study, country_code='USA', country_name='United States', region='AMERICA'
+    )
+    return Site.objects.create(
+        site_id='Study_T_Site_1', study=study, country=country, site_number='Site 1'
+    )
+
+
+@pytest.fixture
+def subject(study, site):
+    return Subject.objects.create(
+        subject_id='Study_T_Subject_1',
+        study=study,
+        site=site,
+        subject_external_id='Subject 1',
+    )
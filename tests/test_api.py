@@ -0,0 +1,34 @@
+"""Tests for the API renderers."""
+
+import math
+from datetime import datetime, timezone
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from apps.api.renderers import ORJSONRenderer
+
+PAYLOAD = {
+    'subject_id': 'Study_T_Subject_1',
+    'computed_at': datetime(2024, 1, 15, 10, 30, 0, 123456, tzinfo=timezone.utc),
+    'open_queries': 3,
+}
+
+
+def test_utc_datetime_offset_differs_from_drf():
+    assert ORJSONRenderer().render(PAYLOAD) == (
+        b'{"subject_id":"Study_T_Subject_1",'
+        b'"computed_at":"2024-01-15T10:30:00.123456+00:00","open_queries":3}'
+    )
+    assert JSONRenderer().render(PAYLOAD) == (
+        b'{"subject_id":"Study_T_Subject_1",'
+        b'"computed_at":"2024-01-15T10:30:00.123456Z","open_queries":3}'
+    )
+
+
+def test_nan_renders_as_null_where_drf_raises():
+    payload = {'risk_score': math.nan}
+
+    assert ORJSONRenderer().render(payload) == b'{"risk_score":null}'
+    with pytest.raises(ValueError):
+        JSONRenderer().render(payload)
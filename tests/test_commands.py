@@ -0,0 +1,109 @@
+"""Tests for the study data loaders and fact retention commands."""
+
+from io import StringIO
+
+import pandas as pd
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+
+from apps.core.management.commands import load_study
+from apps.monitoring.models import AuditEntry, Query
+
+
+def _loader(study):
+    command = load_study.Command()
+    command.study = study
+    command.study_id = study.study_id
+    command._init_stats()
+    return command
+
+
+def _query_sheet(status='Open'):
+    return pd.DataFrame([{
+        'Subject Name': 'Subject 1',
+        'Folder Name': 'Screening',
+        'Form': 'Demographics',
+        'Field OID': 'DM.AGE',
+        'Log #': 'Q-1',
+        'Query Status': status,
+        'Action Owner': 'Site Review',
+        'Query Open Date': '2024-01-15',
+        '# Days Since Open': 3,
+    }])
+
+
+def _audit_entries(model):
+    return AuditEntry.objects.filter(content_type=ContentType.objects.get_for_model(model))
+
+
+@pytest.mark.django_db
+def test_query_load_records_audit_entry(subject):
+    command = _loader(subject.study)
+
+    assert command._load_query_sheet(_query_sheet(), 'Query Report - Cumulative') == 1
+    assert command.rejected_rows == []
+
+    query = Query.objects.get(subject=subject, log_number='Q-1')
+    entry = query.audit
+    assert entry is not None
+    assert entry.created_by.value == load_study.AUDIT_ACTOR
+    assert entry.updated_by is None
+
+
+@pytest.mark.django_db
+def test_query_with_unknown_status_is_rejected(subject):
+    command = _loader(subject.study)
+
+    assert command._load_query_sheet(_query_sheet('Escalated'), 'Query Report - Cumulative') == 0
+
+    assert not Query.objects.exists()
+    assert [row['reason'] for row in command.rejected_rows] == ['Unknown query status/owner: Escalated']
+
+
+@pytest.mark.django_db
+def test_query_reload_updates_audit_entry(subject):
+    command = _loader(subject.study)
+    command._load_query_sheet(_query_sheet(), 'Query Report - Cumulative')
+    command._load_query_sheet(_query_sheet('Closed'), 'Query Report - Cumulative')
+
+    entry = _audit_entries(Query).get()
+    assert entry.created_by.value == load_study.AUDIT_ACTOR
+    assert entry.updated_by.value == load_study.AUDIT_ACTOR
+
+
+@pytest.mark.django_db
+def test_attach_loads_audit_entries_in_one_query(subject, django_assert_num_queries):
+    sheet = pd.concat([_query_sheet(), _query_sheet().assign(**{'Log #': 'Q-2'})])
+    command = _loader(subject.study)
+    command._load_query_sheet(sheet.reset_index(drop=True), 'Query Report - Cumulative')
+    queries = list(Query.objects.order_by('log_number'))
+
+    with django_assert_num_queries(1):
+        AuditEntry.attach(queries)
+        actors = [query.audit.created_by.value for query in queries]
+
+    assert actors == [load_study.AUDIT_ACTOR] * 2
+
+
+@pytest.mark.django_db
+def test_wipe_deletes_audit_entries(subject):
+    command = _loader(subject.study)
+    command._load_query_sheet(_query_sheet(), 'Query Report - Cumulative')
+    assert _audit_entries(Query).count() == 1
+
+    command._wipe_study_data()
+
+    assert not Query.objects.exists()
+    assert not _audit_entries(Query).exists()
+
+
+@pytest.mark.django_db
+def test_prune_deletes_audit_entries(subject):
+    command = _loader(subject.study)
+    command._load_query_sheet(_query_sheet(), 'Query Report - Cumulative')
+
+    call_command('prune_fact_events', before='2024-02-01', stdout=StringIO())
+
+    assert not Query.objects.exists()
+    assert not _audit_entries(Query).exists()
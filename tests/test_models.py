@@ -0,0 +1,142 @@
+"""Tests for the label/status model choices and their data migrations."""
+
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.utils import timezone
+
+from apps.monitoring.models import CRFEvent, Query
+
+
+class TestLabelChoicesParse:
+    def test_matches_label_case_insensitively(self):
+        assert Query.QueryStatus.parse('Open') is Query.QueryStatus.OPEN
+        assert Query.QueryStatus.parse('  cLoSeD ') is Query.QueryStatus.CLOSED
+        assert CRFEvent.EventType.parse('freeze') is CRFEvent.EventType.FREEZE
+
+    def test_matches_member_name_or_label(self):
+        assert Query.ActionOwner.parse('DM') is Query.ActionOwner.DM
+        assert Query.ActionOwner.parse('data management') is Query.ActionOwner.DM
+
+    def test_unknown_label_returns_default(self):
+        # Review variants are mapped by the loaders before parsing
+        assert Query.ActionOwner.parse('Site Review') is None
+        assert Query.ActionOwner.parse('Site Review', Query.ActionOwner.SITE) is Query.ActionOwner.SITE
+
+    @pytest.mark.parametrize('value', [None, '', '   ', 'nan'])
+    def test_empty_values_return_default(self, value):
+        assert Query.QueryStatus.parse(value, Query.QueryStatus.OPEN) is Query.QueryStatus.OPEN
+
+
+def _migrate(*targets):
+    """Migrate to the given nodes and return the historical app registry."""
+    executor = MigrationExecutor(connection)
+    executor.migrate(list(targets))
+    return executor.loader.project_state(list(targets)).apps
+
+
+@pytest.fixture
+def restore_migrations():
+    yield
+    executor = MigrationExecutor(connection)
+    executor.migrate(executor.loader.graph.leaf_nodes())
+
+
+@pytest.mark.django_db(transaction=True)
+def test_query_labels_interned_and_restored(restore_migrations):
+    # Runs 0004-0006 on the configured database; point DB_ENGINE at
+    # PostgreSQL to exercise the deferred FK checks between the steps
+    apps = _migrate(('monitoring', '0003_brin_time_indexes'))
+    study = apps.get_model('core', 'Study').objects.create(study_id='Study_L', study_name='Migration')
+    country = apps.get_model('core', 'Country').objects.create(
+        study=study, country_code='USA', country_name='United States', region='AMERICA'
+    )
+    site = apps.get_model('core', 'Site').objects.create(
+        site_id='Study_L_Site_1', study=study, country=country, site_number='Site 1'
+    )
+    subject = apps.get_model('core', 'Subject').objects.create(
+        subject_id='Study_L_Subject_1', study=study, site=site, subject_external_id='Subject 1'
+    )
+    Query_ = apps.get_model('monitoring', 'Query')
+    labels = [('Screening', 'Demographics'), ('Screening', 'Vitals'), (None, ''), ('Week 4', 'Vitals')]
+    for number, (folder, form) in enumerate(labels):
+        Query_.objects.create(
+            study=study, site=site, subject=subject, log_number=f'Q-{number}',
+            folder_name=folder, form_name=form, query_status='Open', action_owner='Site',
+            query_open_date=date(2024, 1, 15)
+        )
+
+    apps = _migrate(('monitoring', '0006_query_drop_label_columns'))
+    interned = apps.get_model('monitoring', 'Query').objects.order_by('pk')
+    assert list(interned.values_list('folder__value', 'form__value')) == [
+        ('Screening', 'Demographics'), ('Screening', 'Vitals'), (None, 'Unknown'), ('Week 4', 'Vitals'),
+    ]
+    # Each distinct label is stored once
+    assert apps.get_model('core', 'StringDict').objects.filter(value='Vitals').count() == 1
+
+    apps = _migrate(('monitoring', '0003_brin_time_indexes'))
+    restored = apps.get_model('monitoring', 'Query').objects.order_by('pk')
+    assert list(restored.values_list('folder_name', 'form_name')) == [
+        ('Screening', 'Demographics'), ('Screening', 'Vitals'), (None, 'Unknown'), ('Week 4', 'Vitals'),
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_crf_event_type_labels_round_trip(restore_migrations):
+    apps = _migrate(('monitoring', '0006_query_drop_label_columns'))
+    study = apps.get_model('core', 'Study').objects.create(study_id='Study_M', study_name='Migration')
+    CRFEvent_ = apps.get_model('monitoring', 'CRFEvent')
+    for label in ['freeze', ' LOCK ', 'Unsign', 'reopen']:
+        CRFEvent_.objects.create(study=study, event_type=label, event_time=timezone.now())
+
+    # Unrecognised labels stop the migration instead of being coerced
+    with pytest.raises(ValueError, match="crfevent.event_type: 'reopen'"):
+        _migrate(('monitoring', '0007_integer_status_choices'))
+    CRFEvent_.objects.filter(event_type='reopen').delete()
+
+    apps = _migrate(('monitoring', '0007_integer_status_choices'))
+    codes = apps.get_model('monitoring', 'CRFEvent').objects.order_by('pk')
+    assert list(codes.values_list('event_type', flat=True)) == [1, 3, 6]
+
+    apps = _migrate(('monitoring', '0006_query_drop_label_columns'))
+    labels = apps.get_model('monitoring', 'CRFEvent').objects.order_by('pk')
+    assert list(labels.values_list('event_type', flat=True)) == ['freeze', 'lock', 'unsign']
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sae_resolution_status_labels_round_trip(restore_migrations):
+    apps = _migrate(
+        ('monitoring', '0011_open_issue_summary_triggers'),
+        ('safety', '0002_labissue_site_labissue_study_and_more'),
+    )
+    study = apps.get_model('core', 'Study').objects.create(study_id='Study_S', study_name='Migration')
+    country = apps.get_model('core', 'Country').objects.create(
+        study=study, country_code='USA', country_name='United States', region='AMERICA'
+    )
+    site = apps.get_model('core', 'Site').objects.create(
+        site_id='Study_S_Site_1', study=study, country=country, site_number='Site 1'
+    )
+    subject = apps.get_model('core', 'Subject').objects.create(
+        subject_id='Study_S_Subject_1', study=study, site=site, subject_external_id='Subject 1'
+    )
+    SAEDiscrepancy_ = apps.get_model('safety', 'SAEDiscrepancy')
+    for number, label in enumerate(['Open', 'pending', 'CLOSED', 'Escalated']):
+        SAEDiscrepancy_.objects.create(
+            study=study, site=site, subject=subject, discrepancy_id=f'D-{number}',
+            resolution_status=label, discrepancy_created_timestamp=timezone.now()
+        )
+
+    # Unrecognised labels stop the migration instead of being counted as Open
+    with pytest.raises(ValueError, match="'Escalated'"):
+        _migrate(('safety', '0003_saediscrepancy_integer_resolution_status'))
+    SAEDiscrepancy_.objects.filter(resolution_status='Escalated').delete()
+
+    apps = _migrate(('safety', '0003_saediscrepancy_integer_resolution_status'))
+    codes = apps.get_model('safety', 'SAEDiscrepancy').objects.order_by('pk')
+    assert list(codes.values_list('resolution_status', flat=True)) == [1, 2, 4]
+
+    apps = _migrate(('safety', '0002_labissue_site_labissue_study_and_more'))
+    labels = apps.get_model('safety', 'SAEDiscrepancy').objects.order_by('pk')
+    assert list(labels.values_list('resolution_status', flat=True)) == ['Open', 'Pending', 'Closed']
@@ -0,0 +1,97 @@
+"""Tests for the metrics count helpers and the predictive model store."""
+
+from datetime import date
+
+import pytest
+
+from apps.core.models import Site, StringDict, Subject
+from apps.metrics.services.aggregates import count_subquery
+from apps.monitoring.models import MissingVisit, Query
+from apps.predictive.ml_models import PredictiveMLService
+
+
+@pytest.fixture
+def empty_subject(study, site):
+    return Subject.objects.create(
+        subject_id='Study_T_Subject_2',
+        study=study,
+        site=site,
+        subject_external_id='Subject 2',
+    )
+
+
+@pytest.fixture
+def empty_site(study, site):
+    return Site.objects.create(
+        site_id='Study_T_Site_2', study=study, country=site.country, site_number='Site 2'
+    )
+
+
+@pytest.fixture
+def facts(study, site, subject):
+    form_id = StringDict.intern(StringDict.Kind.FORM, ['Demographics'])['Demographics']
+    statuses = [Query.QueryStatus.OPEN, Query.QueryStatus.OPEN, Query.QueryStatus.CLOSED]
+    for number, status in enumerate(statuses):
+        Query.objects.create(
+            study=study, site=site, subject=subject, form_id=form_id,
+            log_number=f'Q-{number}', query_status=status,
+            action_owner=Query.ActionOwner.SITE, query_open_date=date(2024, 1, 15)
+        )
+    for number, resolved in enumerate([False, False, True]):
+        MissingVisit.objects.create(
+            study=study, site=site, subject=subject, visit_name=f'Week {number}',
+            projected_date=date(2024, 1, 1), is_resolved=resolved
+        )
+
+
+@pytest.mark.django_db
+def test_subject_counts_match_per_object_counts(facts, subject, empty_subject):
+    open_queries = Query.objects.filter(query_status=Query.QueryStatus.OPEN)
+    subjects = Subject.objects.annotate(
+        open_query_total=count_subquery(open_queries, 'subject'),
+        missing_visit_total=count_subquery(MissingVisit.objects.all(), 'subject'),
+    ).order_by('subject_id')
+
+    for annotated in subjects:
+        assert annotated.open_query_total == open_queries.filter(subject=annotated).count()
+        assert annotated.missing_visit_total == annotated.missing_visits.count()
+
+    counts = {s.pk: (s.open_query_total, s.missing_visit_total) for s in subjects}
+    assert counts == {subject.pk: (2, 3), empty_subject.pk: (0, 0)}
+
+
+@pytest.mark.django_db
+def test_site_counts_follow_subject_lookup(facts, site, empty_subject, empty_site):
+    open_visits = MissingVisit.objects.filter(is_resolved=False)
+    sites = Site.objects.annotate(
+        subject_count=count_subquery(Subject.objects.all(), 'site'),
+        total_queries=count_subquery(Query.objects.all(), 'subject__site'),
+        missing_visit_count=count_subquery(open_visits, 'subject__site'),
+    )
+
+    for annotated in sites:
+        assert annotated.subject_count == Subject.objects.filter(site=annotated).count()
+        assert annotated.total_queries == Query.objects.filter(subject__site=annotated).count()
+        assert annotated.missing_visit_count == open_visits.filter(subject__site=annotated).count()
+
+    counts = {s.pk: (s.subject_count, s.total_queries, s.missing_visit_count) for s in sites}
+    # Coalesce turns the empty site's NULL subquery result into 0
+    assert counts == {site.pk: (2, 3, 2), empty_site.pk: (0, 0, 0)}
+
+
+def test_bundle_is_skipped_for_a_model_retrained_since(settings, tmp_path):
+    settings.ML_MODELS_DIR = str(tmp_path)
+    service = PredictiveMLService()
+    service._save_model({'version': 1}, service.dropout_model_path)
+    service._save_model({'version': 1}, service.site_perf_model_path)
+    assert service.save_model_bundle() == ['dropout', 'site']
+
+    # Retrained on its own after bundling: the bundle's copy is stale
+    service._save_model({'version': 2}, service.dropout_model_path)
+
+    fresh = PredictiveMLService()
+    assert fresh._get_model(fresh.dropout_model_path) == {'version': 2}
+    assert fresh._get_model(fresh.site_perf_model_path) == {'version': 1}
+    assert fresh._model_cache.keys() == {
+        fresh.manifest_path, fresh.bundle_path, fresh.dropout_model_path
+    }
@@ -0,0 +1,22 @@
+"""Tests for the admin views over the fact tables."""
+
+import pytest
+from django.contrib import admin
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from apps.monitoring.models import Query
+
+
+@pytest.mark.parametrize('url_name, args, deferred', [
+    ('admin:monitoring_query_changelist', [], {'suggested_response'}),
+    ('admin:monitoring_query_change', [1], set()),
+])
+def test_query_admin_defers_long_text_on_changelist_only(url_name, args, deferred):
+    request = RequestFactory().get(reverse(url_name, args=args))
+    request.resolver_match = resolve(request.path)
+
+    queryset = admin.site._registry[Query].get_queryset(request)
+
+    fields, defer = queryset.query.deferred_loading
+    assert defer and set(fields) == deferred